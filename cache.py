@@ -0,0 +1,141 @@
+import hashlib
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    Persistent SQLite store for document embeddings.
+    Vectors are keyed by SHA-256 of (model, text) so unchanged profiles never hit the API twice,
+    and switching embedding models invalidates old entries automatically.
+    """
+
+    # SQLite caps the number of bound parameters per statement
+    _LOOKUP_CHUNK = 500
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, model TEXT NOT NULL, dim INTEGER NOT NULL, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{model}|{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """Return cached vectors for the keys that are present; misses are simply absent."""
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        with self._lock:
+            for start in range(0, len(unique_keys), self._LOOKUP_CHUNK):
+                chunk = unique_keys[start:start + self._LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, model: str, items: Dict[str, Sequence[float]]):
+        if not items:
+            return
+        rows = []
+        for key, vector in items.items():
+            vec = np.asarray(vector, dtype=np.float32)
+            rows.append((key, model, int(vec.shape[0]), vec.tobytes()))
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, model, dim, vector) VALUES (?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+
+class CompletionCache:
+    """
+    Persistent SQLite store for LLM responses keyed by SHA-256 of (model, temperature, prompt).
+    Prompts are built deterministically from profile data, so repeat requests for the same pair skip the model call.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "key TEXT PRIMARY KEY, model TEXT NOT NULL, response TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, temperature: float, prompt: str) -> str:
+        return hashlib.sha256(f"{model}|{temperature}|{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM completions WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, model: str, response: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completions (key, model, response) VALUES (?, ?, ?)", (key, model, response)
+            )
+            self._conn.commit()
+
+
+class SemanticCache:
+    """
+    In-memory LRU of responses keyed by unit-norm query embeddings.
+    A lookup returns the stored response whose query is most cosine-similar to the new one, so near-duplicate
+    requests can skip the whole pipeline. Not persisted: entries depend on the loaded corpus.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # Row i of _keys is the query embedding for _values[i]; allocated on the first put, once the dim is known
+        self._keys: Optional[np.ndarray] = None
+        self._values: List[object] = []
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._clock = 0
+
+    def nearest(self, query: np.ndarray, min_similarity: float) -> Tuple[Optional[object], float]:
+        """
+        Most similar stored response and its cosine similarity. The response is None when it falls below
+        `min_similarity` (or the cache is empty); callers decide which similarities count as an exact hit.
+        """
+        with self._lock:
+            if not self._values:
+                return None, -1.0
+            scores = self._keys[:len(self._values)] @ query
+            best = int(np.argmax(scores))
+            similarity = float(scores[best])
+            if similarity < min_similarity:
+                return None, similarity
+            self._clock += 1
+            self._last_used[best] = self._clock
+            return self._values[best], similarity
+
+    def put(self, query: np.ndarray, value: object):
+        with self._lock:
+            if self._keys is None:
+                self._keys = np.zeros((self.max_entries, query.shape[0]), dtype=np.float32)
+            if len(self._values) < self.max_entries:
+                slot = len(self._values)
+                self._values.append(value)
+            else:
+                # Full: overwrite the least recently used entry
+                slot = int(np.argmin(self._last_used))
+                self._values[slot] = value
+            self._keys[slot] = query
+            self._clock += 1
+            self._last_used[slot] = self._clock
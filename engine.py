@@ -1,106 +1,618 @@
+import asyncio
 import json
 import os
-from typing import List, Dict
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncIterator, Callable, List, Dict, FrozenSet, Iterator, Optional, Tuple
 import numpy as np
 import difflib
 import google.generativeai as genai
 from models import Employee
+from cache import CompletionCache, EmbeddingCache
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; plain NumPy is used when it is missing
+    njit = None
+
+EMBEDDING_MODEL = "models/text-embedding-004"
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", "embedding_cache.sqlite3")
+# Long-form summary and resume parsing use the pro model; short per-pair reasons go to the faster flash tier
+LLM_MODEL = os.getenv("GEMINI_MODEL", "gemini-3-pro-preview")
+REASON_MODEL = os.getenv("GEMINI_REASON_MODEL", "gemini-2.5-flash")
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "llm_cache.sqlite3")
+# Unset by default: the SDK then uses gRPC for sync clients and grpc_asyncio for async ones.
+# Forcing "grpc" would hand the async clients a sync transport and break every *_async call.
+GEMINI_TRANSPORT = os.getenv("GEMINI_TRANSPORT") or None
+# Recent search/resume query embeddings kept in memory
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+# Gemini accepts at most 100 texts per batchEmbedContents call
+EMBEDDING_BATCH_SIZE = 100
+# Cap on batch requests in flight at once, to stay under the API rate limit
+EMBEDDING_MAX_CONCURRENCY = 8
+# Accepted per-pair match content kept in memory, keyed by prompt (which encodes both profiles)
+MATCH_CONTENT_MEMO_SIZE = 4096
+# Minimum cosine similarity for a resume/profile text's candidates
+TEXT_MATCH_MIN_SCORE = 0.2
+
+# Boilerplate that marks an LLM match reason as too generic to show
+GENERIC_REASON_PHRASES = ("both have expertise", "discuss shared interests", "similar areas", "good match")
+
+# Structured-output schema for per-pair match content, so the model can't drift from the expected JSON shape
+MATCH_CONTENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "reasonSummary": {"type": "string"},
+        "collaborationSuggestions": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["reasonSummary", "collaborationSuggestions"]
+}
+
+# Project-name keywords used to detect shared project domains; bit i of a mask marks keyword i
+PROJECT_DOMAIN_KEYWORDS = ('API', 'Database', 'Mobile', 'Data', 'Analytics', 'Payment', 'Migration', 'Pipeline', 'Frontend', 'Backend', 'Cloud', 'Security', 'DevOps')
+
+def _project_domain_mask(project_names: List[str]) -> int:
+    names_lower = [name.lower() for name in project_names]
+    mask = 0
+    for bit, keyword in enumerate(PROJECT_DOMAIN_KEYWORDS):
+        if any(keyword.lower() in name for name in names_lower):
+            mask |= 1 << bit
+    return mask
+
+def _decode_project_domains(mask: int) -> List[str]:
+    return [keyword for bit, keyword in enumerate(PROJECT_DOMAIN_KEYWORDS) if mask >> bit & 1]
+
+# Skill keywords behind the "Both have expertise in X development" reason; bit i of a mask marks category i
+SKILL_DOMAIN_KEYWORDS = {
+    'Backend': ('python', 'java', 'go', 'rust', 'api', 'database', 'sql'),
+    'Frontend': ('react', 'vue', 'angular', 'javascript', 'typescript', 'css'),
+    'Data': ('sql', 'python', 'pandas', 'spark', 'kafka', 'etl'),
+    'Mobile': ('ios', 'android', 'swift', 'kotlin', 'react native')
+}
+SKILL_DOMAINS = tuple(SKILL_DOMAIN_KEYWORDS)
+
+def _skill_domain_mask(skills_text_lower: str) -> int:
+    mask = 0
+    for bit, keywords in enumerate(SKILL_DOMAIN_KEYWORDS.values()):
+        if any(k in skills_text_lower for k in keywords):
+            mask |= 1 << bit
+    return mask
+
+# Skills counted as tech overlap in detailed matches
+TECH_KEYWORDS = frozenset({
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'React', 'Angular', 'Vue',
+    'SQL', 'PostgreSQL', 'MongoDB', 'Docker', 'Kubernetes', 'AWS', 'GCP', 'Kafka', 'Redis', 'Elasticsearch', 'Terraform'
+})
+
+# Query words that look like capitalized names but mark a skill/role search instead
+NON_NAME_KEYWORDS = frozenset({'python', 'java', 'react', 'node', 'aws', 'cloud', 'data', 'manager', 'lead', 'developer', 'engineer'})
+
+# Search shorthand expanded before matching skills, tools, projects and roles
+SEARCH_SYNONYMS = {
+    'js': 'javascript', 'ts': 'typescript', 'py': 'python',
+    'ml': 'machine learning', 'ai': 'artificial intelligence',
+    'fe': 'frontend', 'be': 'backend'
+}
+
+# Engineering context categories surfaced to the match-content LLM prompt
+ARCHITECTURE_KEYWORDS = {
+    "Microservices": ["microservice", "distributed"],
+    "Serverless": ["lambda", "serverless", "cloud functions"],
+    "Event-Driven": ["kafka", "rabbitmq", "event", "pub/sub"],
+    "REST/GraphQL": ["rest", "graphql", "api"],
+    "Data Pipelines": ["etl", "pipeline", "airflow", "spark"]
+}
+
+TOOLING_KEYWORDS = {
+    "Containerization": ["docker", "kubernetes", "k8s", "container"],
+    "CI/CD": ["jenkins", "github actions", "gitlab ci", "circleci"],
+    "IaC": ["terraform", "ansible", "cloudformation"],
+    "Observability": ["prometheus", "grafana", "datadog", "new relic"],
+    "Cloud": ["aws", "gcp", "azure"]
+}
+
+def _extract_patterns(skills: List[str], projects: List[object]) -> Dict[str, List[str]]:
+    """Architecture and tooling categories mentioned in skills and project names/descriptions."""
+    patterns = {
+        "architecture": [],
+        "tooling": []
+    }
+    
+    # Check skills and project descriptions
+    text_corpus = " ".join(skills).lower() + " " + " ".join([p.name + " " + getattr(p, "description", "") for p in projects]).lower()
+    
+    for cat, kws in ARCHITECTURE_KEYWORDS.items():
+        if any(kw in text_corpus for kw in kws):
+            patterns["architecture"].append(cat)
+            
+    for cat, kws in TOOLING_KEYWORDS.items():
+        if any(kw in text_corpus for kw in kws):
+            patterns["tooling"].append(cat)
+    
+    return patterns
+
+def _profile_text(emp: Employee) -> str:
+    """Embedding text for an employee without raw_text, built in a single f-string."""
+    profile = emp.profile
+    # Handle Project objects
+    projects = f"Projects: {', '.join(p.name if hasattr(p, 'name') else str(p) for p in profile.projects)}. " if profile.projects else ""
+    return (
+        f"{emp.name}, {profile.role} in {profile.department}. "
+        f"Skills: {', '.join(profile.skills)}. "
+        f"{projects}"
+        f"Interests: {', '.join(profile.interests)}."
+    )
+
+@lru_cache(maxsize=65536)
+def _fuzzy_word_match(term: str, word: str, threshold: float) -> bool:
+    """difflib similarity test for one (term, word) pair; skill and tool vocabularies are small, so pairs repeat heavily."""
+    matcher = difflib.SequenceMatcher(None, term, word)
+    # real_quick_ratio and quick_ratio are cheap upper bounds on ratio, so most pairs are rejected before the full match
+    return matcher.real_quick_ratio() > threshold and matcher.quick_ratio() > threshold and matcher.ratio() > threshold
+
+@lru_cache(maxsize=65536)
+def _name_similarity(query_lower: str, name_lower: str) -> float:
+    """
+    Fuzzy name score for search_employees_by_name: SequenceMatcher ratio, lifted to 0.7 when one
+    matching block covers most of the query. Returns 0.0 when the pair is below the 0.6 cutoff.
+    """
+    matcher = difflib.SequenceMatcher(None, query_lower, name_lower)
+    query_len = len(query_lower)
+    # Cheap upper bounds first: ratio <= quick_ratio <= real_quick_ratio, and the longest block
+    # can't exceed the shorter string (O(1)) or the shared character count (quick_ratio's numerator)
+    shortest = min(query_len, len(name_lower))
+    if matcher.real_quick_ratio() <= 0.6 and (shortest <= 2 or shortest / query_len <= 0.7):
+        return 0.0
+    quick = matcher.quick_ratio()
+    if quick <= 0.6:
+        shared = round(quick * (query_len + len(name_lower)) / 2)
+        if shared <= 2 or shared / query_len <= 0.7:
+            return 0.0
+
+    similarity = matcher.ratio()
+    match = matcher.find_longest_match(0, query_len, 0, len(name_lower))
+    if match.size > 2 and match.size / query_len > 0.7:
+        similarity = max(similarity, 0.7)
+    return similarity if similarity > 0.6 else 0.0
+
+# Name characters are counted per code point; everything past ASCII shares the last bucket
+NAME_HIST_BINS = 128
+
+def _char_histograms(texts: List[str]) -> np.ndarray:
+    """
+    Row i counts the characters of texts[i]. Summing the element-wise minimum of two rows gives
+    quick_ratio's shared-character count exactly for ASCII text, and an upper bound otherwise.
+    """
+    hist = np.zeros((len(texts), NAME_HIST_BINS), dtype=np.uint16)
+    for row, text in enumerate(texts):
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        hist[row] = np.bincount(np.minimum(codes, NAME_HIST_BINS - 1), minlength=NAME_HIST_BINS)
+    return hist
+
+# Below this many rows the BLAS matvec beats the JIT kernel's dispatch overhead
+NUMBA_MIN_ROWS = 2048
+# Rows scanned per parallel chunk by the fused kernel; each chunk keeps its own top-k
+NUMBA_CHUNK_ROWS = 1024
+
+# From this many rows on, searches shortlist candidates on an int8 copy of the matrix (~4x less memory traffic)
+INT8_MIN_ROWS = 20000
+# The int8 shortlist holds this many times k rows, which are then rescored exactly in float32
+INT8_SHORTLIST_FACTOR = 4
+# int8 scores can be off by ~1e-3; the shortlist threshold is lowered by this much so borderline rows survive
+INT8_SCORE_MARGIN = 0.02
+
+if njit is not None:
+    @njit(inline="always")
+    def _insert_candidate(cand_idx, cand_val, c, i, score):
+        """Insert row i into chunk c's candidate list, kept sorted by descending score."""
+        pos = cand_val.shape[1] - 1
+        while pos > 0 and cand_val[c, pos - 1] < score:
+            cand_val[c, pos] = cand_val[c, pos - 1]
+            cand_idx[c, pos] = cand_idx[c, pos - 1]
+            pos -= 1
+        cand_val[c, pos] = score
+        cand_idx[c, pos] = i
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fused_top_k_kernel(matrix, query, k, threshold):
+        """Dot product, threshold and top-k in one pass; returns per-chunk candidates (index -1 marks an empty slot)."""
+        n_rows = matrix.shape[0]
+        n_chunks = (n_rows + NUMBA_CHUNK_ROWS - 1) // NUMBA_CHUNK_ROWS
+        cand_idx = np.full((n_chunks, k), -1, dtype=np.int64)
+        cand_val = np.full((n_chunks, k), -np.inf, dtype=np.float32)
+        for c in prange(n_chunks):
+            start = c * NUMBA_CHUNK_ROWS
+            stop = min(start + NUMBA_CHUNK_ROWS, n_rows)
+            # Scores go to a chunk-local buffer first; branching in the same loop would stop the dot products vectorizing
+            scores = np.empty(stop - start, dtype=np.float32)
+            for i in range(start, stop):
+                acc = np.float32(0.0)
+                for j in range(matrix.shape[1]):
+                    acc += matrix[i, j] * query[j]
+                scores[i - start] = acc
+            for i in range(start, stop):
+                score = scores[i - start]
+                if score > threshold and score > cand_val[c, k - 1]:
+                    _insert_candidate(cand_idx, cand_val, c, i, score)
+        return cand_idx.ravel(), cand_val.ravel()
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fused_top_k_int8_kernel(matrix, row_scales, query, query_scale, k, threshold):
+        """_fused_top_k_kernel over int8 rows: int32 dot products rescaled to approximate cosine scores."""
+        n_rows = matrix.shape[0]
+        n_chunks = (n_rows + NUMBA_CHUNK_ROWS - 1) // NUMBA_CHUNK_ROWS
+        cand_idx = np.full((n_chunks, k), -1, dtype=np.int64)
+        cand_val = np.full((n_chunks, k), -np.inf, dtype=np.float32)
+        for c in prange(n_chunks):
+            start = c * NUMBA_CHUNK_ROWS
+            stop = min(start + NUMBA_CHUNK_ROWS, n_rows)
+            dots = np.empty(stop - start, dtype=np.int32)
+            for i in range(start, stop):
+                acc = np.int32(0)
+                for j in range(matrix.shape[1]):
+                    acc += np.int32(matrix[i, j]) * np.int32(query[j])
+                dots[i - start] = acc
+            for i in range(start, stop):
+                score = np.float32(dots[i - start]) * row_scales[i] * query_scale
+                if score > threshold and score > cand_val[c, k - 1]:
+                    _insert_candidate(cand_idx, cand_val, c, i, score)
+        return cand_idx.ravel(), cand_val.ravel()
+else:
+    _fused_top_k_kernel = None
+    _fused_top_k_int8_kernel = None
+
+@lru_cache(maxsize=None)
+def _compile_top_k_kernel(quantized: bool):
+    """JIT-compile one fused top-k kernel for the argument types searches pass it; runs once per process."""
+    if quantized:
+        _fused_top_k_int8_kernel(
+            np.zeros((1, 1), dtype=np.int8), np.ones(1, dtype=np.float32), np.zeros(1, dtype=np.int8), np.float32(1.0), 1, np.float32(-np.inf)
+        )
+        return
+    # Numba compiles read-only arrays as a separate signature: _embed_query results are read-only, matrix rows are not
+    read_only_query = np.zeros(1, dtype=np.float32)
+    read_only_query.flags.writeable = False
+    for query in (read_only_query, np.zeros(1, dtype=np.float32)):
+        _fused_top_k_kernel(np.zeros((1, 1), dtype=np.float32), query, 1, np.float32(-np.inf))
+
+def _quantize_int8(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric int8 quantization along the last axis; returns (int8 values, float32 scales)."""
+    scales = np.abs(values).max(axis=-1) / 127.0
+    scales = np.where(scales == 0, 1.0, scales).astype(np.float32)
+    quantized = np.rint(values / scales[..., None]).astype(np.int8)
+    return quantized, scales
+
+def _unit_vector(vector: np.ndarray) -> np.ndarray:
+    """Scale a query embedding to unit length so scoring against the pre-normalized matrix is a plain dot product."""
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+def _query_embedding_from(result: dict) -> np.ndarray:
+    """Unit-norm float32 vector from an embed_content response; marked read-only because the memo shares it."""
+    # float32 to match the matrix; a float64 query would upcast the whole matrix and skip sgemv
+    query_embedding = _unit_vector(np.asarray(result['embedding'], dtype=np.float32))
+    query_embedding.flags.writeable = False
+    return query_embedding
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first, without sorting the whole array."""
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= len(scores):
+        return np.argsort(-scores)
+    candidates = np.argpartition(-scores, k)[:k]
+    return candidates[np.argsort(-scores[candidates])]
+
+def _top_k_matches(
+    matrix: np.ndarray,
+    query: np.ndarray,
+    k: int,
+    threshold: float = -np.inf,
+    quantized: Optional[Tuple[np.ndarray, np.ndarray]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Indices and cosine scores of the (at most) k rows scoring above threshold, best first.
+    Both matrix rows and query must be unit-norm. With `quantized` (int8 rows and scales from _quantize_int8),
+    a shortlist is picked on the int8 copy and rescored exactly against the float32 rows.
+    """
+    if quantized is not None and _fused_top_k_int8_kernel is not None and 0 < k * INT8_SHORTLIST_FACTOR < matrix.shape[0]:
+        query_i8, query_scale = _quantize_int8(np.asarray(query, dtype=np.float32))
+        idx, _ = _fused_top_k_int8_kernel(
+            quantized[0], quantized[1], query_i8, np.float32(query_scale), k * INT8_SHORTLIST_FACTOR, np.float32(threshold - INT8_SCORE_MARGIN)
+        )
+        idx = idx[idx >= 0]
+        scores = matrix[idx] @ query
+        order = np.argsort(-scores, kind="stable")[:k]
+        idx, scores = idx[order], scores[order]
+        keep = scores > threshold
+        return idx[keep], scores[keep]
+    if _fused_top_k_kernel is not None and matrix.shape[0] >= NUMBA_MIN_ROWS and 0 < k < matrix.shape[0]:
+        idx, scores = _fused_top_k_kernel(matrix, np.ascontiguousarray(query, dtype=np.float32), k, np.float32(threshold))
+        filled = idx >= 0
+        idx, scores = idx[filled], scores[filled]
+        order = np.argsort(-scores, kind="stable")[:k]
+        return idx[order], scores[order]
+    # float32 operands on a C-contiguous matrix dispatch straight to BLAS sgemv
+    scores = matrix @ query
+    idx = _top_k_indices(scores, k)
+    idx = idx[scores[idx] > threshold]
+    return idx, scores[idx]
+
+class _RejectedResponse(ValueError):
+    """Raised by _cached_generate when `parse` rejects a model response; keeps the text so callers can retry with feedback."""
+    def __init__(self, reason: str, response: str):
+        super().__init__(reason)
+        self.response = response
+
+@dataclass(frozen=True)
+class _EmployeeFeatures:
+    """Lookup structures derived from one employee's profile, built once at load time."""
+    employee: Employee
+    skills: FrozenSet[str]
+    project_names_lower: Tuple[str, ...]
+    project_domain_mask: int
+    architecture_patterns: FrozenSet[str]
+    tooling_patterns: FrozenSet[str]
+    skill_domain_mask: int
+    # Lowercased text for search reasons, paired with the original spelling for display
+    skills_lower: Tuple[Tuple[str, str], ...]
+    tools_lower: Tuple[Tuple[str, str], ...]
+    # (name, "name\ndescription" lowercased); query terms never contain newlines, so matches can't straddle the two
+    projects_text_lower: Tuple[Tuple[str, str], ...]
+    role_lower: str
+    # Name search keys
+    name_lower: str
+    email_prefix_lower: str
+
+    @classmethod
+    def build(cls, emp: Employee) -> "_EmployeeFeatures":
+        profile = emp.profile
+        patterns = _extract_patterns(profile.skills, profile.projects)
+        return cls(
+            employee=emp,
+            skills=frozenset(profile.skills),
+            project_names_lower=tuple(p.name.lower() for p in profile.projects),
+            project_domain_mask=_project_domain_mask([p.name for p in profile.projects]),
+            architecture_patterns=frozenset(patterns["architecture"]),
+            tooling_patterns=frozenset(patterns["tooling"]),
+            skill_domain_mask=_skill_domain_mask(' '.join(profile.skills).lower()),
+            skills_lower=tuple((skill, skill.lower()) for skill in profile.skills),
+            tools_lower=tuple((tool, tool.lower()) for tool in profile.tools),
+            projects_text_lower=tuple((p.name, f"{p.name}\n{p.description}".lower()) for p in profile.projects),
+            role_lower=profile.role.lower(),
+            name_lower=emp.name.lower(),
+            email_prefix_lower=emp.email.lower().split('@')[0],
+        )
 
 class CollabEngine:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, embedding_cache_path: str = EMBEDDING_CACHE_PATH, llm_cache_path: str = LLM_CACHE_PATH):
         self.employees: List[Employee] = []
+        # Persistent embedding cache keyed by content hash
+        self.embedding_cache = EmbeddingCache(embedding_cache_path)
+        # Persistent LLM response cache keyed by prompt hash
+        self.completion_cache = CompletionCache(llm_cache_path)
         # Initialize Gemini client
         if api_key:
-            genai.configure(api_key=api_key)
+            genai.configure(api_key=api_key, transport=GEMINI_TRANSPORT)
         elif os.getenv("GEMINI_API_KEY"):
-            genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+            genai.configure(api_key=os.getenv("GEMINI_API_KEY"), transport=GEMINI_TRANSPORT)
         
-        self.model = genai.GenerativeModel('gemini-3-pro-preview')
+        self.model = genai.GenerativeModel(LLM_MODEL)
+        self.reason_model = genai.GenerativeModel(REASON_MODEL)
         self.embeddings_matrix = None
+        self._embeddings_int8: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        # Employee id -> row in self.employees and embeddings_matrix
+        self.id_to_idx: Dict[str, int] = {}
+        self._features: Dict[str, _EmployeeFeatures] = {}
+        # Row-aligned with self.employees: lowercased-name character counts and lengths for name search
+        self._name_hist = np.zeros((0, NAME_HIST_BINS), dtype=np.uint16)
+        self._name_lengths = np.zeros(0, dtype=np.int64)
+        # Skill vocabulary of the loaded employees (lowercased -> original spelling) and one pattern matching any of it
+        self._skill_spellings: Dict[str, str] = {}
+        self._skill_pattern: Optional[re.Pattern] = None
+        # Accepted per-pair match content, least recently used first
+        self._match_memo: "OrderedDict[str, tuple]" = OrderedDict()
+        # Uncached async generations in flight, keyed by completion-cache key
+        self._inflight_generations: Dict[str, "asyncio.Future"] = {}
+        # Requests currently awaiting each of those calls
+        self._generation_waiters: Dict["asyncio.Future", int] = {}
+        self._match_memo_lock = threading.Lock()
+        # Recent search/resume query embeddings, least recently used first; shared by the sync and async paths
+        self._query_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        # Uncached async query embeddings in flight, keyed by query text
+        self._inflight_query_embeddings: Dict[str, "asyncio.Future"] = {}
+        self._query_embeddings_lock = threading.Lock()
 
     def load_employees(self, employees: List[Employee]):
-        self.employees = employees
+        self._index_employees(employees)
         self._compute_embeddings()
 
+    async def load_employees_async(self, employees: List[Employee]):
+        """Async variant of load_employees; embedding batches are awaited on the event loop instead of pool threads."""
+        self._index_employees(employees)
+        await self._compute_embeddings_async()
+
+    def _index_employees(self, employees: List[Employee]):
+        self.employees = employees
+        self.id_to_idx = {emp.id: idx for idx, emp in enumerate(employees)}
+        self._features = {emp.id: _EmployeeFeatures.build(emp) for emp in employees}
+        names_lower = [self._features[emp.id].name_lower for emp in employees]
+        self._name_hist = _char_histograms(names_lower)
+        self._name_lengths = np.fromiter((len(name) for name in names_lower), dtype=np.int64, count=len(names_lower))
+        
+        self._skill_spellings = {}
+        for emp in employees:
+            for skill in emp.profile.skills:
+                self._skill_spellings.setdefault(skill.lower(), skill)
+        # Longest first so multi-word skills win over their parts; lookarounds instead of \b so "C++" and ".NET" match
+        alternatives = sorted(self._skill_spellings, key=len, reverse=True)
+        self._skill_pattern = re.compile(
+            r"(?<!\w)(?:" + "|".join(map(re.escape, alternatives)) + r")(?!\w)"
+        ) if alternatives else None
+
+    def get_employee(self, employee_id: str) -> Optional[Employee]:
+        """O(1) lookup through id_to_idx instead of scanning self.employees."""
+        idx = self.id_to_idx.get(employee_id)
+        return self.employees[idx] if idx is not None else None
+
+    def get_embedding(self, employee_id: str) -> Optional[np.ndarray]:
+        """Unit-norm embedding row for a loaded employee (a view into embeddings_matrix), or None."""
+        idx = self.id_to_idx.get(employee_id)
+        if idx is None or self.embeddings_matrix is None:
+            return None
+        return self.embeddings_matrix[idx]
+
+    def _features_for(self, emp: Employee) -> _EmployeeFeatures:
+        """Precomputed features for loaded employees; ad-hoc targets (e.g. parsed resumes) are built on demand."""
+        features = self._features.get(emp.id)
+        if features is None or features.employee is not emp:
+            features = _EmployeeFeatures.build(emp)
+        return features
+
     def _compute_embeddings(self):
         if not self.employees:
             return
         print("Generating embeddings using Gemini...")
-        texts = []
-        for emp in self.employees:
-            if not emp.raw_text:
-                # Construct from profile if raw_text missing
-                text = f"{emp.name}, {emp.profile.role} in {emp.profile.department}. "
-                text += f"Skills: {', '.join(emp.profile.skills)}. "
-                
-                # Handle Project objects
-                if emp.profile.projects:
-                    project_names = [p.name if hasattr(p, 'name') else str(p) for p in emp.profile.projects]
-                    text += f"Projects: {', '.join(project_names)}. "
-                
-                text += f"Interests: {', '.join(emp.profile.interests)}."
-                emp.raw_text = text
-            texts.append(emp.raw_text)
+        texts = self._embedding_texts()
         
-        # Batch generation might be needed for large sets, but for 20-50 it's fine
-        # We'll do it in one go or small batches
-        # Batch generation might be needed for large sets, but for 20-50 it's fine
-        # We'll do it in one go or small batches
         try:
-            # Gemini embedding model
-            # Using 'models/text-embedding-004'
+            keys, cached, missing, batches = self._plan_embedding_batches(texts)
             
-            for idx, emp in enumerate(self.employees):
-                result = genai.embed_content(
-                    model="models/text-embedding-004",
-                    content=emp.raw_text,
-                    task_type="retrieval_document",
-                    title="Employee Profile"
-                )
-                emp.embedding = result['embedding']
+            # Misses go out in batches of EMBEDDING_BATCH_SIZE, several batches in parallel
+            fresh = {}
+            if batches:
+                with ThreadPoolExecutor(max_workers=min(EMBEDDING_MAX_CONCURRENCY, len(batches))) as pool:
+                    results = pool.map(lambda batch: self._embed_documents([missing[key] for key in batch]), batches)
+                    for batch, vectors in zip(batches, results):
+                        fresh.update(zip(batch, vectors))
+            self._store_embeddings(keys, cached, fresh)
+        except Exception as e:
+            self._reset_embeddings(e)
+
+    async def _compute_embeddings_async(self):
+        """Async variant of _compute_embeddings; a semaphore gives the same in-flight bound as the thread pool."""
+        if not self.employees:
+            return
+        print("Generating embeddings using Gemini...")
+        texts = self._embedding_texts()
+        
+        try:
+            keys, cached, missing, batches = self._plan_embedding_batches(texts)
             
-            # Update embeddings_matrix for similarity calculations
-            self.embeddings_matrix = np.array([emp.embedding for emp in self.employees])
+            semaphore = asyncio.Semaphore(EMBEDDING_MAX_CONCURRENCY)
+            async def embed(batch):
+                async with semaphore:
+                    return await self._embed_documents_async([missing[key] for key in batch])
             
-            print(f"Generated embeddings for {len(self.employees)} employees.")
+            results = await asyncio.gather(*(embed(batch) for batch in batches))
+            fresh = {}
+            for batch, vectors in zip(batches, results):
+                fresh.update(zip(batch, vectors))
+            self._store_embeddings(keys, cached, fresh)
         except Exception as e:
-            print(f"Error generating embeddings: {e}")
-            # Set empty embeddings as fallback
-            for emp in self.employees:
-                emp.embedding = [0.0] * 768  # Default dimension for text-embedding-004 is 768
-            self.embeddings_matrix = None # Ensure matrix is reset if error occurs
+            self._reset_embeddings(e)
+
+    def _embedding_texts(self) -> List[str]:
+        # Construct from profile if raw_text missing
+        texts = [emp.raw_text or _profile_text(emp) for emp in self.employees]
+        for emp, text in zip(self.employees, texts):
+            if not emp.raw_text:
+                emp.raw_text = text
+        return texts
+
+    def _plan_embedding_batches(self, texts: List[str]) -> tuple:
+        """Cache lookup for every text; returns (keys, cached, missing key -> text, batches of missing keys)."""
+        # Gemini embedding model
+        # Only profiles whose text changed since the last run are sent to the API
+        keys = [EmbeddingCache.make_key(EMBEDDING_MODEL, text) for text in texts]
+        cached = self.embedding_cache.get_many(keys)
+        
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+        
+        missing_keys = list(missing)
+        batches = [missing_keys[i:i + EMBEDDING_BATCH_SIZE] for i in range(0, len(missing_keys), EMBEDDING_BATCH_SIZE)]
+        return keys, cached, missing, batches
+
+    def _store_embeddings(self, keys: List[str], cached: Dict[str, np.ndarray], fresh: Dict[str, np.ndarray]):
+        """Persist fresh vectors and assemble the normalized embeddings matrix in employee order."""
+        self.embedding_cache.put_many(EMBEDDING_MODEL, fresh)
+        
+        # Update embeddings_matrix for similarity calculations
+        # Stored as contiguous float32 and read through get_embedding; Employee objects hold no copy
+        first = cached[keys[0]] if keys[0] in cached else fresh[keys[0]]
+        matrix = np.empty((len(self.employees), len(first)), dtype=np.float32)
+        for idx, key in enumerate(keys):
+            matrix[idx] = cached[key] if key in cached else fresh[key]
+        
+        # Rows are L2-normalized once here so cosine similarity is a plain dot product
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        self.embeddings_matrix = matrix
+        # Large matrices also keep an int8 copy that searches use to shortlist candidates
+        self._embeddings_int8 = _quantize_int8(matrix) if _fused_top_k_int8_kernel is not None and len(matrix) >= INT8_MIN_ROWS else None
+        # Compile the kernels this corpus will use now, so the first large query doesn't pay for it
+        if _fused_top_k_kernel is not None and len(matrix) >= NUMBA_MIN_ROWS:
+            _compile_top_k_kernel(quantized=False)
+            if self._embeddings_int8 is not None:
+                _compile_top_k_kernel(quantized=True)
+        
+        print(f"Generated embeddings for {len(self.employees)} employees ({len(fresh)} new, {len(self.employees) - len(fresh)} cached).")
+
+    def _reset_embeddings(self, error: Exception):
+        print(f"Error generating embeddings: {error}")
+        # Without a matrix, searches return no results and get_embedding returns None
+        self.embeddings_matrix = None # Ensure matrix is reset if error occurs
+        self._embeddings_int8 = None
+
+    def _embed_documents(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed one batch of profile texts with a single batchEmbedContents call.
+        The response is decoded once into a (len(texts), dim) float32 array so rows copy straight into the matrix.
+        """
+        result = genai.embed_content(
+            model=EMBEDDING_MODEL,
+            content=texts,
+            task_type="retrieval_document",
+            title="Employee Profile"
+        )
+        return np.asarray(result['embedding'], dtype=np.float32)
+
+    async def _embed_documents_async(self, texts: List[str]) -> np.ndarray:
+        """Async variant of _embed_documents."""
+        result = await genai.embed_content_async(
+            model=EMBEDDING_MODEL,
+            content=texts,
+            task_type="retrieval_document",
+            title="Employee Profile"
+        )
+        return np.asarray(result['embedding'], dtype=np.float32)
 
     def find_similar_employees(self, target_employee_id: str, top_k: int = 5) -> List[Dict]:
         if self.embeddings_matrix is None:
             return []
 
-        # Find index of target employee
-        target_idx = -1
-        for idx, emp in enumerate(self.employees):
-            if emp.id == target_employee_id:
-                target_idx = idx
-                break
-        
+        # Find row of target employee
+        target_idx = self.id_to_idx.get(target_employee_id, -1)
         if target_idx == -1:
             return []
 
-        # Compute cosine similarity
-        all_embeddings = self.embeddings_matrix
-        target_embedding = all_embeddings[target_idx]
-        
-        # Normalize
-        norm_target = np.linalg.norm(target_embedding)
-        all_norms = np.linalg.norm(all_embeddings, axis=1)
-        dot_products = np.dot(all_embeddings, target_embedding)
-        cosine_sim = dot_products / (all_norms * norm_target)
-        
-        # Get top_k similar indices (excluding self)
-        sorted_indices = cosine_sim.argsort()[::-1]  # Sort descending
+        # Cosine similarity and top_k selection (rows are pre-normalized; one extra slot in case self is among them)
+        sorted_indices, scores = _top_k_matches(
+            self.embeddings_matrix, self.embeddings_matrix[target_idx], top_k + 1, quantized=self._embeddings_int8
+        )
         
         recommendations = []
-        target_emp = self.employees[target_idx]
+        target_features = self._features_for(self.employees[target_idx])
         
-        for idx in sorted_indices:
+        for idx, score in zip(sorted_indices, scores):
             if idx == target_idx:
                 continue  # Skip the target employee itself
             
@@ -108,12 +620,11 @@ class CollabEngine:
                 break
             
             emp = self.employees[idx]
-            score = cosine_sim[idx]
             
             recommendations.append({
                 "employee": emp,
                 "score": float(score),
-                "reason": self._compute_reason(target_emp, emp)
+                "reason": self._compute_reason(target_features, self._features_for(emp))
             })
         
         return recommendations
@@ -125,49 +636,130 @@ class CollabEngine:
 
         print("Generating embedding for resume text...")
         try:
-            result = genai.embed_content(
-                model="models/text-embedding-004",
-                content=text,
-                task_type="retrieval_query"
-            )
-            query_embedding = result['embedding']
+            query_embedding = self._embed_query(text)
         except Exception as e:
             print(f"Error generating embedding: {e}")
             return []
 
-        # Compute cosine similarity
-        norm_query = np.linalg.norm(query_embedding)
-        all_norms = np.linalg.norm(self.embeddings_matrix, axis=1)
-        
-        # Avoid division by zero
-        all_norms[all_norms == 0] = 1e-9
-        if norm_query == 0: norm_query = 1e-9
-        
-        dot_products = np.dot(self.embeddings_matrix, query_embedding)
-        cosine_sim = dot_products / (all_norms * norm_query)
-        
-        # Get top_k similar indices
-        sorted_indices = cosine_sim.argsort()[::-1]
+        return self.find_similar_employees_by_embedding(query_embedding, top_k)
+
+    async def find_similar_employees_by_text_async(self, text: str, top_k: int = 5) -> List[Dict]:
+        """Async variant of find_similar_employees_by_text; the embedding call does not block the event loop."""
+        if self.embeddings_matrix is None or not self.employees:
+            return []
+
+        print("Generating embedding for resume text...")
+        try:
+            query_embedding = await self._embed_query_async(text)
+        except Exception as e:
+            print(f"Error generating embedding: {e}")
+            return []
+
+        return self.find_similar_employees_by_embedding(query_embedding, top_k)
+
+    def find_similar_employees_by_embedding(self, query_embedding: np.ndarray, top_k: int = 5) -> List[Dict]:
+        """Candidates for an already embedded (unit-norm) resume/profile text."""
+        if self.embeddings_matrix is None:
+            return []
+
+        # Cosine similarity and top_k selection, filtering low relevance (rows and query are pre-normalized)
+        sorted_indices, scores = _top_k_matches(
+            self.embeddings_matrix, query_embedding, top_k, threshold=TEXT_MATCH_MIN_SCORE, quantized=self._embeddings_int8
+        )
         
         recommendations = []
         
-        for idx in sorted_indices:
-            if len(recommendations) >= top_k:
-                break
-            
-            emp = self.employees[idx]
-            score = cosine_sim[idx]
-            
-            # Filter low relevance
-            if score > 0.2:
-                recommendations.append({
-                    "employee": emp,
-                    "score": float(score),
-                    "reason": "" # Will be computed later
-                })
+        for idx, score in zip(sorted_indices, scores):
+            recommendations.append({
+                "employee": self.employees[idx],
+                "score": float(score),
+                "reason": "" # Will be computed later
+            })
         
         return recommendations
 
+    def embed_query(self, text: str) -> np.ndarray:
+        """Read-only unit-norm query embedding, shared with the search paths' memo; raises if the API call fails."""
+        return self._embed_query(text)
+
+    async def embed_query_async(self, text: str) -> np.ndarray:
+        """Async variant of embed_query."""
+        return await self._embed_query_async(text)
+
+    def _embed_query(self, text: str) -> np.ndarray:
+        """
+        Unit-norm float32 query embedding; repeated searches are served from memory instead of the API.
+        Failed calls raise and are not cached. The returned array is shared, so it is marked read-only.
+        """
+        query_embedding = self._query_embedding_get(text)
+        if query_embedding is not None:
+            return query_embedding
+
+        result = genai.embed_content(
+            model=EMBEDDING_MODEL,
+            content=text,
+            task_type="retrieval_query"
+        )
+        query_embedding = _query_embedding_from(result)
+        self._query_embedding_put(text, query_embedding)
+        return query_embedding
+
+    async def _embed_query_async(self, text: str) -> np.ndarray:
+        """Async variant of _embed_query using the SDK's non-blocking client."""
+        query_embedding = self._query_embedding_get(text)
+        if query_embedding is not None:
+            return query_embedding
+
+        async def embed() -> np.ndarray:
+            result = await genai.embed_content_async(
+                model=EMBEDDING_MODEL,
+                content=text,
+                task_type="retrieval_query"
+            )
+            query_embedding = _query_embedding_from(result)
+            self._query_embedding_put(text, query_embedding)
+            return query_embedding
+
+        # Concurrent requests for the same uncached text share one embedding call
+        call = self._inflight_query_embeddings.get(text)
+        if call is None or call.get_loop() is not asyncio.get_running_loop():
+            call = asyncio.ensure_future(embed())
+            self._inflight_query_embeddings[text] = call
+            call.add_done_callback(lambda done: self._forget_inflight(self._inflight_query_embeddings, text, done))
+        # Shielded so one cancelled request doesn't cancel the call for the others waiting on it
+        return await asyncio.shield(call)
+
+    def _query_embedding_get(self, text: str) -> Optional[np.ndarray]:
+        with self._query_embeddings_lock:
+            query_embedding = self._query_embeddings.get(text)
+            if query_embedding is not None:
+                self._query_embeddings.move_to_end(text)
+            return query_embedding
+
+    def _query_embedding_put(self, text: str, query_embedding: np.ndarray):
+        with self._query_embeddings_lock:
+            self._query_embeddings[text] = query_embedding
+            self._query_embeddings.move_to_end(text)
+            if len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embeddings.popitem(last=False)
+
+    async def warmup_async(self):
+        """
+        One throwaway embedding and one 1-token generation per model, so the gRPC channels and the SDK's lazily
+        built async clients exist before the first real request. Bypasses the completion cache; failures only log.
+        """
+        try:
+            await asyncio.gather(
+                self.embed_query_async("warmup"),
+                *(
+                    model.generate_content_async("ping", generation_config=genai.types.GenerationConfig(max_output_tokens=1))
+                    for model in (self.model, self.reason_model)
+                )
+            )
+            print("Gemini clients warmed up.")
+        except Exception as e:
+            print(f"[WARN] Warm-up failed (first request will pay connection setup): {e}")
+
     def _is_likely_name(self, query: str) -> bool:
         """
         Heuristic to check if a query is likely a name.
@@ -179,8 +771,7 @@ class CollabEngine:
             return False
             
         # Check for common tech keywords that might look like names but aren't
-        tech_keywords = {'python', 'java', 'react', 'node', 'aws', 'cloud', 'data', 'manager', 'lead', 'developer', 'engineer'}
-        if any(p.lower() in tech_keywords for p in parts):
+        if any(p.lower() in NON_NAME_KEYWORDS for p in parts):
             return False
             
         # If capitalized and short, likely a name
@@ -198,10 +789,7 @@ class CollabEngine:
             return True
             
         # Check individual words for fuzzy match
-        for word in text_lower.split():
-            if difflib.SequenceMatcher(None, term_lower, word).ratio() > threshold:
-                return True
-        return False
+        return any(_fuzzy_word_match(term_lower, word, threshold) for word in text_lower.split())
 
     def search_employees(self, query: str, top_k: int = 10) -> List[Dict]:
         """
@@ -219,46 +807,53 @@ class CollabEngine:
         
         # 1. Compute Embedding Similarity
         try:
-            query_embedding_result = genai.embed_content(
-                model="models/text-embedding-004",
-                content=query,
-                task_type="retrieval_query"
-            )
-            query_embedding = query_embedding_result['embedding']
+            query_embedding = self._embed_query(query)
         except Exception as e:
             print(f"Error generating query embedding: {e}")
             return []
 
+        return self._search_by_embedding(query, query_embedding, top_k)
+
+    async def search_employees_async(self, query: str, top_k: int = 10) -> List[Dict]:
+        """Async variant of search_employees; the embedding call does not block the event loop."""
+        if not self.employees:
+            return []
+
+        if self._is_likely_name(query):
+            print(f"Query '{query}' detected as name. Routing to name search.")
+            return self.search_employees_by_name(query, top_k)
+
+        print(f"Embedding similarity search triggered for: {query}")
+        
+        try:
+            query_embedding = await self._embed_query_async(query)
+        except Exception as e:
+            print(f"Error generating query embedding: {e}")
+            return []
+
+        return self._search_by_embedding(query, query_embedding, top_k)
+
+    def _search_by_embedding(self, query: str, query_embedding: np.ndarray, top_k: int) -> List[Dict]:
+        """Ranked keyword-search results with their search reasons, for an already embedded query."""
         # Calculate cosine similarity if matrix exists
         if self.embeddings_matrix is None:
             print("Embeddings matrix is empty. Cannot perform search.")
             return []
 
-        norm_query = np.linalg.norm(query_embedding)
-        all_norms = np.linalg.norm(self.embeddings_matrix, axis=1)
-        
-        # Avoid division by zero
-        all_norms[all_norms == 0] = 1e-9
-        if norm_query == 0: norm_query = 1e-9
-        
-        dot_products = np.dot(self.embeddings_matrix, query_embedding)
-        semantic_scores = dot_products / (all_norms * norm_query)
+        # Rows and query are pre-normalized; low relevance is filtered in the same pass
+        sorted_indices, semantic_scores = _top_k_matches(
+            self.embeddings_matrix, query_embedding, top_k, threshold=0.25, quantized=self._embeddings_int8
+        )
 
-        # Collect results
-        results = []
-        for idx, score in enumerate(semantic_scores):
-            # Filter low relevance
-            if score > 0.25:
-                emp = self.employees[idx]
-                results.append({
-                    "employee": emp,
-                    "score": float(score),
-                    "whyMatched": self._compute_search_reason(emp, query, [])
-                })
-
-        # Sort by score descending
-        results.sort(key=lambda x: x["score"], reverse=True)
-        top_results = results[:top_k]
+        # Collect the top_k results, best first
+        top_results = []
+        for idx, score in zip(sorted_indices, semantic_scores):
+            emp = self.employees[idx]
+            top_results.append({
+                "employee": emp,
+                "score": float(score),
+                "whyMatched": self._compute_search_reason(emp, query, [])
+            })
         
         if top_results:
             print(f"Top match score: {top_results[0]['score']:.4f}")
@@ -278,13 +873,14 @@ class CollabEngine:
         
         results = []
         query_lower = name_query.lower()
+        fuzzy_candidates = self._fuzzy_name_candidates(query_lower)
         
-        for emp in self.employees:
+        for idx, emp in enumerate(self.employees):
             score = 0.0
             reasons = []
             
-            name_lower = emp.name.lower()
-            email_lower = emp.email.lower()
+            features = self._features_for(emp)
+            name_lower = features.name_lower
             
             # 1. Exact match (highest score)
             if query_lower == name_lower:
@@ -296,27 +892,16 @@ class CollabEngine:
                 score = 0.8
                 reasons.append(f"Name contains '{name_query}'")
             
-            # 3. Fuzzy match using SequenceMatcher
-            else:
-                # Check similarity ratio
-                matcher = difflib.SequenceMatcher(None, query_lower, name_lower)
-                similarity = matcher.ratio()
-                
-                # Check partial ratio (if query is a part of the name but with typos)
-                # We can simulate partial ratio by checking if the matching block is significant
-                match = matcher.find_longest_match(0, len(query_lower), 0, len(name_lower))
-                if match.size > 2: # At least 3 chars match
-                    # Boost score if the matched block is a significant portion of the query
-                    if match.size / len(query_lower) > 0.7:
-                        similarity = max(similarity, 0.7)
-                
+            # 3. Fuzzy match using SequenceMatcher (memoized), for names the histogram bound didn't rule out
+            elif fuzzy_candidates[idx]:
+                similarity = _name_similarity(query_lower, name_lower)
                 if similarity > 0.6: # Threshold for fuzzy match
                     score = similarity * 0.9 # Penalty for being fuzzy
                     reasons.append(f"Similar name to '{name_query}'")
             
             # 4. Email prefix match
             if score < 1.0:
-                email_prefix = email_lower.split('@')[0]
+                email_prefix = features.email_prefix_lower
                 if query_lower == email_prefix:
                     score = max(score, 0.9)
                     reasons.append(f"Matches email prefix: {emp.email}")
@@ -336,103 +921,169 @@ class CollabEngine:
         
         return results[:top_k]
 
+    def extract_known_skills(self, text: str) -> List[str]:
+        """Skills from the loaded employees' vocabulary mentioned in text, in their original spelling, first mention first."""
+        if self._skill_pattern is None:
+            return []
+        return list(dict.fromkeys(self._skill_spellings[m] for m in self._skill_pattern.findall(text.lower())))
+
+    def _fuzzy_name_candidates(self, query_lower: str) -> np.ndarray:
+        """
+        Mask over self.employees of names that could pass _name_similarity's quick_ratio cutoff,
+        computed for all names at once from the character histograms.
+        """
+        query_len = len(query_lower)
+        if query_len == 0 or len(self._name_hist) == 0:
+            return np.zeros(len(self.employees), dtype=bool)
+        query_hist = _char_histograms([query_lower])[0]
+        shared = np.minimum(self._name_hist, query_hist).sum(axis=1, dtype=np.int64)
+        # Same expressions as _name_similarity's quick_ratio check, so every name it would keep stays in
+        quick = 2.0 * shared / (query_len + self._name_lengths)
+        return (quick > 0.6) | ((shared > 2) & (shared / query_len > 0.7))
+
     def _compute_search_reason(self, emp: Employee, query: str, matched_terms: List[str]) -> List[str]:
         """Generate reasons why this employee matched the search query."""
         reasons = []
         query_lower = query.lower()
         
-        # Synonyms map
-        synonyms = {
-            'js': 'javascript', 'ts': 'typescript', 'py': 'python', 
-            'ml': 'machine learning', 'ai': 'artificial intelligence',
-            'fe': 'frontend', 'be': 'backend'
-        }
-        
         # Expand query with synonyms
         query_terms = query_lower.split()
         expanded_terms = set(query_terms)
         for term in query_terms:
-            if term in synonyms:
-                expanded_terms.add(synonyms[term])
+            if term in SEARCH_SYNONYMS:
+                expanded_terms.add(SEARCH_SYNONYMS[term])
+        
+        features = self._features_for(emp)
         
         # Check for skill matches (fuzzy)
-        matched_skills = []
-        for skill in emp.profile.skills:
-            skill_lower = skill.lower()
-            if any(self._fuzzy_match(term, skill_lower) for term in expanded_terms):
-                matched_skills.append(skill)
+        matched_skills = [
+            skill for skill, skill_lower in features.skills_lower
+            if any(self._fuzzy_match(term, skill_lower) for term in expanded_terms)
+        ]
         
         if matched_skills:
             reasons.append(f"Matches skill{'s' if len(matched_skills)>1 else ''}: {', '.join(matched_skills[:3])}.")
             
         # Check for tool matches (fuzzy)
-        matched_tools = []
-        for tool in emp.profile.tools:
-            tool_lower = tool.lower()
-            if any(self._fuzzy_match(term, tool_lower) for term in expanded_terms):
-                matched_tools.append(tool)
-                
+        matched_tools = [
+            tool for tool, tool_lower in features.tools_lower
+            if any(self._fuzzy_match(term, tool_lower) for term in expanded_terms)
+        ]
+        
         if matched_tools:
             reasons.append(f"Experience with tool{'s' if len(matched_tools)>1 else ''}: {', '.join(matched_tools[:3])}.")
             
-        # Check for project matches
-        matched_projects = [p.name for p in emp.profile.projects if any(term in p.name.lower() or term in p.description.lower() for term in expanded_terms)]
-        if matched_projects:
-            reasons.append(f"Worked on relevant project: {matched_projects[0]}.")
+        # Check for project matches (only the first is shown)
+        matched_project = next((name for name, text_lower in features.projects_text_lower if any(term in text_lower for term in expanded_terms)), None)
+        if matched_project:
+            reasons.append(f"Worked on relevant project: {matched_project}.")
+        
+        # Reasons are distinct by construction and capped at 3, so the role check is skipped once the cap is reached
+        if len(reasons) >= 3:
+            return reasons
             
         # Check for role/title match
-        if any(term in emp.profile.role.lower() for term in expanded_terms):
+        if any(term in features.role_lower for term in expanded_terms):
             reasons.append(f"Current role is {emp.profile.role}.")
             
         # Fallback if no specific matches found but score was high (likely semantic)
         if not reasons:
             reasons.append("Profile content is semantically similar to your search.")
             
-        return list(set(reasons))[:3] # Deduplicate and limit
+        return reasons
     
-    def _compute_reason(self, target_emp: Employee, candidate_emp: Employee) -> str:
+    def _compute_reason(self, target_features: _EmployeeFeatures, candidate_features: _EmployeeFeatures) -> str:
         """Generates a simple, deterministic reason for the match based on shared skills and projects."""
+        target_emp, candidate_emp = target_features.employee, candidate_features.employee
         
-        # 1. Shared Skills
-        shared_skills = list(set(target_emp.profile.skills) & set(candidate_emp.profile.skills))
-        
-        # 2. Project Overlap (Fuzzy)
-        target_projects = [p.name.lower() for p in target_emp.profile.projects]
-        candidate_projects = [p.name.lower() for p in candidate_emp.profile.projects]
-        
-        common_projects = []
-        for tp in target_projects:
-            for cp in candidate_projects:
-                if self._fuzzy_match(tp, cp, threshold=0.85): # High threshold for project names
-                    common_projects.append(cp.title()) # Capitalize for display
-                    
-        # 3. Domain Categories
-        domains = {
-            'Backend': ['python', 'java', 'go', 'rust', 'api', 'database', 'sql'],
-            'Frontend': ['react', 'vue', 'angular', 'javascript', 'typescript', 'css'],
-            'Data': ['sql', 'python', 'pandas', 'spark', 'kafka', 'etl'],
-            'Mobile': ['ios', 'android', 'swift', 'kotlin', 'react native']
-        }
+        # Only the first qualifying reason is reported, so each check stops at its first hit
+        # 1. Project Overlap (Fuzzy)
+        common_project = next((
+            cp for tp in target_features.project_names_lower for cp in candidate_features.project_names_lower
+            if self._fuzzy_match(tp, cp, threshold=0.85) # High threshold for project names
+        ), None)
+        if common_project:
+            return f"Shared experience on similar projects like {common_project.title()}." # Capitalize for display
         
-        shared_domains = []
-        for domain, keywords in domains.items():
-            t_has = any(k in ' '.join(target_emp.profile.skills).lower() for k in keywords)
-            c_has = any(k in ' '.join(candidate_emp.profile.skills).lower() for k in keywords)
-            if t_has and c_has:
-                shared_domains.append(domain)
-
-        # Generate Sentence
-        if common_projects:
-            return f"Shared experience on similar projects like {common_projects[0]}."
-        elif len(shared_skills) >= 2:
+        # 2. Shared Skills
+        shared_skills = sorted(target_features.skills & candidate_features.skills)
+        if len(shared_skills) >= 2:
             return f"Strong alignment on {', '.join(shared_skills[:3])}."
-        elif shared_domains:
-            return f"Both have expertise in {shared_domains[0]} development."
-        elif target_emp.profile.department == candidate_emp.profile.department:
+        
+        # 3. Domain Categories (keyword scan done once per employee; see SKILL_DOMAIN_KEYWORDS)
+        shared_mask = target_features.skill_domain_mask & candidate_features.skill_domain_mask
+        if shared_mask:
+            domain = next(domain for bit, domain in enumerate(SKILL_DOMAINS) if shared_mask >> bit & 1)
+            return f"Both have expertise in {domain} development."
+        
+        # 4. Department
+        if target_emp.profile.department == candidate_emp.profile.department:
             return f"Colleagues in the {target_emp.profile.department} department."
         else:
             return "Complementary technical background and skills."
     
+    def _cached_generate(self, model: genai.GenerativeModel, prompt: str, temperature: float, json_mode: bool = False, parse: Optional[Callable] = None, schema: Optional[dict] = None):
+        """
+        generate_content behind the prompt-hash completion cache.
+        A response is only cached once `parse` accepts it, so rejected output is retried next time;
+        rejections surface as _RejectedResponse carrying the raw text.
+        """
+        key = CompletionCache.make_key(model.model_name, temperature, prompt)
+        cached = self.completion_cache.get(key)
+        if cached is not None:
+            return parse(cached) if parse else cached
+        
+        response = model.generate_content(prompt, generation_config=self._generation_config(temperature, json_mode, schema))
+        try:
+            result = parse(response.text) if parse else response.text
+        except ValueError as e:
+            raise _RejectedResponse(str(e), response.text) from e
+        self.completion_cache.put(key, model.model_name, response.text)
+        return result
+
+    async def _cached_generate_async(self, model: genai.GenerativeModel, prompt: str, temperature: float, json_mode: bool = False, parse: Optional[Callable] = None, schema: Optional[dict] = None):
+        """Async variant of _cached_generate."""
+        key = CompletionCache.make_key(model.model_name, temperature, prompt)
+        cached = self.completion_cache.get(key)
+        if cached is not None:
+            return parse(cached) if parse else cached
+        
+        # Concurrent requests for the same uncached prompt share one model call
+        call = self._inflight_generations.get(key)
+        if call is None or call.get_loop() is not asyncio.get_running_loop():
+            call = asyncio.ensure_future(
+                model.generate_content_async(prompt, generation_config=self._generation_config(temperature, json_mode, schema))
+            )
+            self._inflight_generations[key] = call
+            call.add_done_callback(lambda done: self._forget_inflight(self._inflight_generations, key, done))
+        # Shielded so one cancelled request doesn't cancel the call for the others waiting on it
+        self._generation_waiters[call] = self._generation_waiters.get(call, 0) + 1
+        try:
+            response = await asyncio.shield(call)
+        finally:
+            self._generation_waiters[call] -= 1
+            if not self._generation_waiters[call]:
+                del self._generation_waiters[call]
+                # No-op once the call is done; otherwise every waiter was cancelled and nobody needs the result
+                call.cancel()
+        try:
+            result = parse(response.text) if parse else response.text
+        except ValueError as e:
+            raise _RejectedResponse(str(e), response.text) from e
+        self.completion_cache.put(key, model.model_name, response.text)
+        return result
+
+    def _forget_inflight(self, inflight: Dict[str, "asyncio.Future"], key: str, done: "asyncio.Future"):
+        if inflight.get(key) is done:
+            del inflight[key]
+
+    def _generation_config(self, temperature: float, json_mode: bool, schema: Optional[dict] = None):
+        return genai.types.GenerationConfig(
+            temperature=temperature,
+            response_mime_type="application/json" if json_mode else None,
+            response_schema=schema
+        )
+
     def generate_match_reasons(self, target_emp: Employee, recommendations: List[Dict]) -> Dict[str, str]:
         print("Generating match reasons using LLM...")
         
@@ -472,39 +1123,150 @@ class CollabEngine:
         """
         
         try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.5, # Lower temperature for consistency
-                    response_mime_type="application/json"
-                )
-            )
-            return json.loads(response.text)
+            # Temperature 0 keeps the output deterministic, which makes the cached response valid to reuse
+            return self._cached_generate(self.reason_model, prompt, temperature=0.0, json_mode=True, parse=json.loads)
         except Exception as e:
             print(f"Error generating match reasons: {e}")
             return {}
 
     def generate_detailed_match(self, target_emp: Employee, matched_emp: Employee, use_llm: bool = True) -> dict:
         """Generate comprehensive match details including shared skills, projects, and LLM-powered suggestions"""
+        target_features = self._features_for(target_emp)
+        matched_features = self._features_for(matched_emp)
+        details = self._compute_match_overlap(target_features, matched_features)
+        
+        # Generate reason summary and collaboration suggestions
+        if use_llm:
+            (reason_summary, collab_suggestions), fallback = self._generate_llm_match_content(
+                target_features, matched_features, details["shared_skills"], details["matching_projects"], details["tech_overlap"]
+            )
+        else:
+            reason_summary, collab_suggestions = self._heuristic_match_content(target_features, matched_features, details)
+            fallback = False
+        
+        details["reason_summary"] = reason_summary
+        details["collaboration_suggestions"] = collab_suggestions
+        # True when the LLM content failed and was replaced by _fallback_match_content
+        details["fallback"] = fallback
+        return details
+    
+    async def generate_detailed_match_async(self, target_emp: Employee, matched_emp: Employee, use_llm: bool = True) -> dict:
+        """Async variant of generate_detailed_match; the LLM call does not block the event loop."""
+        return await self._detailed_match_async(self._features_for(target_emp), self._features_for(matched_emp), use_llm)
+    
+    async def generate_detailed_matches_as_completed(self, target_emp: Employee, matched_emps: List[Employee]) -> AsyncIterator[Tuple[int, dict]]:
+        """
+        Per-pair LLM match details for every candidate, yielded as (index in matched_emps, details)
+        in the order they finish, so callers can render each one without waiting for the slowest.
+        """
+        target_features = self._features_for(target_emp)
+        
+        async def detailed(idx: int, emp: Employee) -> Tuple[int, dict]:
+            return idx, await self._detailed_match_async(target_features, self._features_for(emp), True)
+        
+        for next_done in asyncio.as_completed([detailed(idx, emp) for idx, emp in enumerate(matched_emps)]):
+            yield await next_done
+    
+    async def _detailed_match_async(self, target_features: _EmployeeFeatures, matched_features: _EmployeeFeatures, use_llm: bool) -> dict:
+        details = self._compute_match_overlap(target_features, matched_features)
+        
+        if use_llm:
+            (reason_summary, collab_suggestions), fallback = await self._generate_llm_match_content_async(
+                target_features, matched_features, details["shared_skills"], details["matching_projects"], details["tech_overlap"]
+            )
+        else:
+            reason_summary, collab_suggestions = self._heuristic_match_content(target_features, matched_features, details)
+            fallback = False
         
-        # Calculate shared skills
-        shared_skills = list(set(target_emp.profile.skills) & set(matched_emp.profile.skills))
+        details["reason_summary"] = reason_summary
+        details["collaboration_suggestions"] = collab_suggestions
+        details["fallback"] = fallback
+        return details
+    
+    async def generate_detailed_matches_async(self, target_emp: Employee, matched_emps: List[Employee], use_llm: bool = True) -> List[dict]:
+        """
+        Detailed matches for all candidates with a single LLM call; the target profile is sent once.
+        Pairs already in the match memo are not re-sent, and candidates the batched response
+        misses or gets wrong fall back to per-pair calls, which run concurrently.
+        """
+        # The target's features are built once here and shared by every candidate
+        target_features = self._features_for(target_emp)
+        matched_features = [self._features_for(emp) for emp in matched_emps]
+        all_details = [self._compute_match_overlap(target_features, features) for features in matched_features]
+        if not use_llm:
+            for features, details in zip(matched_features, all_details):
+                details["reason_summary"], details["collaboration_suggestions"] = self._heuristic_match_content(target_features, features, details)
+                details["fallback"] = False
+            return all_details
         
-        # Find matching project domains (simplified string matching)
-        target_projects = [p.name for p in target_emp.profile.projects]
-        matched_projects = [p.name for p in matched_emp.profile.projects]
+        contents, pair_prompts, pending = self._plan_batch_match(target_features, matched_features, all_details)
+        if pending:
+            prompt = self._build_batch_match_prompt(target_features, pending)
+            try:
+                batch = await self._cached_generate_async(self.reason_model, prompt, temperature=0.0, json_mode=True, parse=self._parse_batch_match_content)
+                contents.update(self._memoize_batch_contents(pair_prompts, batch))
+            except Exception as e:
+                print(f"[ERROR] batched match content failed: {e}")
         
-        # Check for similar project domains
-        matching_project_domains = []
-        common_keywords = ['API', 'Database', 'Mobile', 'Data', 'Analytics', 'Payment', 'Migration', 'Pipeline', 'Frontend', 'Backend', 'Cloud', 'Security', 'DevOps']
-        for keyword in common_keywords:
-            if any(keyword.lower() in tp.lower() for tp in target_projects) and any(keyword.lower() in mp.lower() for mp in matched_projects):
-                matching_project_domains.append(keyword)
+        missing = [(features, details) for features, details in zip(matched_features, all_details) if features.employee.id not in contents]
+        retried = await asyncio.gather(*(
+            self._generate_llm_match_content_async(
+                target_features, features, details["shared_skills"], details["matching_projects"], details["tech_overlap"]
+            ) for features, details in missing
+        ))
+        contents.update((features.employee.id, content) for (features, _), (content, _) in zip(missing, retried))
+        fallback_ids = {features.employee.id for (features, _), (_, fallback) in zip(missing, retried) if fallback}
+        
+        for emp, details in zip(matched_emps, all_details):
+            details["reason_summary"], details["collaboration_suggestions"] = contents[emp.id]
+            details["fallback"] = emp.id in fallback_ids
+        return all_details
+    
+    def _plan_batch_match(self, target_features: _EmployeeFeatures, matched_features: List[_EmployeeFeatures], all_details: List[dict]) -> tuple:
+        """
+        Split candidates for a batched call: returns (memoized contents by id, per-pair prompt by id,
+        (candidate features, details) pairs still to generate).
+        """
+        contents = {}
+        pair_prompts = {}
+        pending = []
+        for features, details in zip(matched_features, all_details):
+            emp_id = features.employee.id
+            prompt, _ = self._build_match_prompt(
+                target_features, features, details["shared_skills"], details["matching_projects"], details["tech_overlap"]
+            )
+            pair_prompts[emp_id] = prompt
+            content = self._match_memo_get(prompt)
+            if content is not None:
+                contents[emp_id] = content
+            else:
+                pending.append((features, details))
+        return contents, pair_prompts, pending
+
+    def _memoize_batch_contents(self, pair_prompts: Dict[str, str], batch: Dict[str, tuple]) -> Dict[str, tuple]:
+        """Keep batched entries for requested candidates and memoize them under their per-pair prompts."""
+        accepted = {}
+        for emp_id, content in batch.items():
+            prompt = pair_prompts.get(emp_id)
+            if prompt is None:
+                continue
+            self._match_memo_put(prompt, content)
+            accepted[emp_id] = content
+        return accepted
+
+    def _compute_match_overlap(self, target_features: _EmployeeFeatures, matched_features: _EmployeeFeatures) -> dict:
+        """Deterministic overlap between two profiles (skills, project domains, tech, seniority, department)."""
+        target_emp, matched_emp = target_features.employee, matched_features.employee
+        
+        # Calculate shared skills (sorted: set order varies per process and would change prompts and cache keys)
+        shared_skills = sorted(target_features.skills & matched_features.skills)
+        
+        # Check for similar project domains (precomputed keyword bitmasks)
+        shared_domain_mask = target_features.project_domain_mask & matched_features.project_domain_mask
+        matching_project_domains = _decode_project_domains(shared_domain_mask)
         
         # Tech overlap (shared skills that are tech-related)
-        tech_keywords = ['Python', 'Java', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'React', 'Angular', 'Vue', 
-                        'SQL', 'PostgreSQL', 'MongoDB', 'Docker', 'Kubernetes', 'AWS', 'GCP', 'Kafka', 'Redis', 'Elasticsearch', 'Terraform']
-        tech_overlap = [skill for skill in shared_skills if skill in tech_keywords]
+        tech_overlap = [skill for skill in shared_skills if skill in TECH_KEYWORDS]
         
         # Check seniority matching
         seniority_levels = {'Junior': 1, 'Mid': 2, 'Senior': 3, 'Lead': 4, 'Staff': 5, 'Principal': 6}
@@ -517,32 +1279,26 @@ class CollabEngine:
         if target_emp.profile.department == matched_emp.profile.department:
             matching_domains.append(target_emp.profile.department)
         
-        # Generate reason summary and collaboration suggestions
-        if use_llm:
-            reason_summary, collab_suggestions = self._generate_llm_match_content(
-                target_emp, matched_emp, shared_skills, matching_project_domains, tech_overlap
-            )
-        else:
-            # Heuristic fallback
-            reason_summary = self._compute_reason(target_emp, matched_emp)
-            collab_suggestions = []
-            if shared_skills:
-                collab_suggestions.append(f"Collaborate on tasks involving {shared_skills[0]}.")
-            if matching_project_domains:
-                collab_suggestions.append(f"Share knowledge on {matching_project_domains[0]} projects.")
-            if not collab_suggestions:
-                collab_suggestions.append("Connect to discuss shared professional interests.")
-        
         return {
             "shared_skills": shared_skills,
             "matching_projects": matching_project_domains,
             "matching_domains": matching_domains,
             "tech_overlap": tech_overlap,
-            "matching_seniority": matching_seniority,
-            "reason_summary": reason_summary,
-            "collaboration_suggestions": collab_suggestions
+            "matching_seniority": matching_seniority
         }
     
+    def _heuristic_match_content(self, target_features: _EmployeeFeatures, matched_features: _EmployeeFeatures, details: dict) -> tuple:
+        """Reason summary and collaboration suggestions without calling the LLM."""
+        reason_summary = self._compute_reason(target_features, matched_features)
+        collab_suggestions = []
+        if details["shared_skills"]:
+            collab_suggestions.append(f"Collaborate on tasks involving {details['shared_skills'][0]}.")
+        if details["matching_projects"]:
+            collab_suggestions.append(f"Share knowledge on {details['matching_projects'][0]} projects.")
+        if not collab_suggestions:
+            collab_suggestions.append("Connect to discuss shared professional interests.")
+        return reason_summary, collab_suggestions
+    
     def parse_profile_from_text(self, text: str) -> Dict:
         """
         Uses LLM to parse raw text (resume or typed background) into a structured profile.
@@ -550,7 +1306,24 @@ class CollabEngine:
         """
         print("Parsing profile from text...")
         
-        prompt = f"""
+        try:
+            return self._cached_generate(self.model, self._build_parse_prompt(text), temperature=0.0, json_mode=True, parse=json.loads)
+        except Exception as e:
+            print(f"Error parsing profile: {e}")
+            return self._default_parsed_profile()
+
+    async def parse_profile_from_text_async(self, text: str) -> Dict:
+        """Async variant of parse_profile_from_text."""
+        print("Parsing profile from text...")
+        
+        try:
+            return await self._cached_generate_async(self.model, self._build_parse_prompt(text), temperature=0.0, json_mode=True, parse=json.loads)
+        except Exception as e:
+            print(f"Error parsing profile: {e}")
+            return self._default_parsed_profile()
+
+    def _build_parse_prompt(self, text: str) -> str:
+        return f"""
         Analyze the following professional background text and extract structured data.
         
         TEXT:
@@ -576,115 +1349,113 @@ class CollabEngine:
         - Extract at least 3-5 skills if possible.
         - Extract at least 1 project if mentioned.
         """
-        
-        try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.1, # Low temp for extraction
-                    response_mime_type="application/json"
-                )
-            )
-            return json.loads(response.text)
-        except Exception as e:
-            print(f"Error parsing profile: {e}")
-            # Return safe default
-            return {
-                "role": "Unknown",
-                "seniority": "Unknown",
-                "department": "Engineering",
-                "skills": [],
-                "projects": []
-            }
+
+    def _default_parsed_profile(self) -> Dict:
+        # Return safe default; "fallback" tells callers the parse failed (the model's output never carries it)
+        return {
+            "role": "Unknown",
+            "seniority": "Unknown",
+            "department": "Engineering",
+            "skills": [],
+            "projects": [],
+            "fallback": True
+        }
 
     def _generate_llm_match_content(
         self,
-        target_emp: Employee,
-        matched_emp: Employee,
+        target_features: _EmployeeFeatures,
+        matched_features: _EmployeeFeatures,
         shared_skills: list,
         matching_projects: list,
         tech_overlap: list
-    ) -> tuple:
+    ) -> Tuple[tuple, bool]:
         """Use LLM to generate reason summary and collaboration suggestions 
         using strict JSON prompts + anti-hallucination rules.
+        Returns (content, fallback), where fallback is True when the heuristic fallback content was used.
         """
+        prompt, shared_arch = self._build_match_prompt(target_features, matched_features, shared_skills, matching_projects, tech_overlap)
 
-        # ---- CONTEXT EXTRACTION HELPERS ----
-        def extract_patterns(skills: List[str], projects: List[object]) -> Dict[str, List[str]]:
-            patterns = {
-                "architecture": [],
-                "tooling": []
-            }
-            
-            arch_keywords = {
-                "Microservices": ["microservice", "distributed"],
-                "Serverless": ["lambda", "serverless", "cloud functions"],
-                "Event-Driven": ["kafka", "rabbitmq", "event", "pub/sub"],
-                "REST/GraphQL": ["rest", "graphql", "api"],
-                "Data Pipelines": ["etl", "pipeline", "airflow", "spark"]
-            }
-            
-            tool_keywords = {
-                "Containerization": ["docker", "kubernetes", "k8s", "container"],
-                "CI/CD": ["jenkins", "github actions", "gitlab ci", "circleci"],
-                "IaC": ["terraform", "ansible", "cloudformation"],
-                "Observability": ["prometheus", "grafana", "datadog", "new relic"],
-                "Cloud": ["aws", "gcp", "azure"]
-            }
-            
-            # Check skills and project descriptions
-            text_corpus = " ".join(skills).lower() + " " + " ".join([p.name + " " + getattr(p, "description", "") for p in projects]).lower()
-            
-            for cat, kws in arch_keywords.items():
-                if any(kw in text_corpus for kw in kws):
-                    patterns["architecture"].append(cat)
-                    
-            for cat, kws in tool_keywords.items():
-                if any(kw in text_corpus for kw in kws):
-                    patterns["tooling"].append(cat)
-            
-            return patterns
+        # ---- CALL THE MODEL ----
+        content = self._match_memo_get(prompt)
+        if content is not None:
+            return content, False
 
-        target_patterns = extract_patterns(target_emp.profile.skills, target_emp.profile.projects)
-        match_patterns = extract_patterns(matched_emp.profile.skills, matched_emp.profile.projects)
-        
-        shared_arch = list(set(target_patterns["architecture"]) & set(match_patterns["architecture"]))
-        shared_tooling = list(set(target_patterns["tooling"]) & set(match_patterns["tooling"]))
+        try:
+            try:
+                content = self._cached_generate(self.reason_model, prompt, temperature=0.0, json_mode=True, parse=self._validate_match_content, schema=MATCH_CONTENT_SCHEMA)
+            except _RejectedResponse as rejected:
+                # One corrective round-trip with the rejected answer inlined beats dropping straight to the fallback
+                print(f"[WARN] match content rejected ({rejected}); retrying with feedback")
+                retry_prompt = self._build_match_retry_prompt(prompt, rejected)
+                content = self._cached_generate(self.reason_model, retry_prompt, temperature=0.0, json_mode=True, parse=self._validate_match_content, schema=MATCH_CONTENT_SCHEMA)
+        except Exception as e:
+            print(f"[ERROR] generate_llm_match_content failed or rejected: {e}")
+            return self._fallback_match_content(shared_arch, matching_projects, tech_overlap), True
 
-        # ---- PREPARE STRUCTURED JSON INPUT FOR THE LLM ----
-        def project_to_dict(p):
-            return {
-                "name": p.name,
-                "description": getattr(p, "description", ""),
-                "tech": getattr(p, "tech", [])
-            }
+        # Fallbacks are not memoized, so a transient failure is retried on the next request
+        self._match_memo_put(prompt, content)
+        return content, False
 
-        target_json = {
-            "name": target_emp.name,
-            "role": target_emp.profile.role,
-            "skills": target_emp.profile.skills[:15], # Increased limit
-            "projects": [project_to_dict(p) for p in target_emp.profile.projects],
-            "department": target_emp.profile.department,
-            "seniority": target_emp.profile.seniority,
-        }
+    async def _generate_llm_match_content_async(
+        self,
+        target_features: _EmployeeFeatures,
+        matched_features: _EmployeeFeatures,
+        shared_skills: list,
+        matching_projects: list,
+        tech_overlap: list
+    ) -> Tuple[tuple, bool]:
+        """Async variant of _generate_llm_match_content using the SDK's non-blocking client."""
+        prompt, shared_arch = self._build_match_prompt(target_features, matched_features, shared_skills, matching_projects, tech_overlap)
 
-        match_json = {
-            "name": matched_emp.name,
-            "role": matched_emp.profile.role,
-            "skills": matched_emp.profile.skills[:15],
-            "projects": [project_to_dict(p) for p in matched_emp.profile.projects],
-            "department": matched_emp.profile.department,
-            "seniority": matched_emp.profile.seniority,
-        }
+        content = self._match_memo_get(prompt)
+        if content is not None:
+            return content, False
 
-        overlap_json = {
-            "sharedSkills": shared_skills,
-            "sharedTech": tech_overlap,
-            "projectDomainOverlap": matching_projects,
-            "architecturePatterns": shared_arch,
-            "toolingOverlap": shared_tooling,
-            "matchingSeniority": target_emp.profile.seniority == matched_emp.profile.seniority,
-        }
+        try:
+            try:
+                content = await self._cached_generate_async(self.reason_model, prompt, temperature=0.0, json_mode=True, parse=self._validate_match_content, schema=MATCH_CONTENT_SCHEMA)
+            except _RejectedResponse as rejected:
+                print(f"[WARN] match content rejected ({rejected}); retrying with feedback")
+                retry_prompt = self._build_match_retry_prompt(prompt, rejected)
+                content = await self._cached_generate_async(self.reason_model, retry_prompt, temperature=0.0, json_mode=True, parse=self._validate_match_content, schema=MATCH_CONTENT_SCHEMA)
+        except Exception as e:
+            print(f"[ERROR] generate_llm_match_content failed or rejected: {e}")
+            return self._fallback_match_content(shared_arch, matching_projects, tech_overlap), True
+
+        self._match_memo_put(prompt, content)
+        return content, False
+
+    def _match_memo_get(self, prompt: str) -> Optional[tuple]:
+        with self._match_memo_lock:
+            content = self._match_memo.get(prompt)
+            if content is None:
+                return None
+            self._match_memo.move_to_end(prompt)
+        # Fresh suggestions list per caller, so edits to one response can't leak into the memo
+        reason_summary, collab_suggestions = content
+        return reason_summary, list(collab_suggestions)
+
+    def _match_memo_put(self, prompt: str, content: tuple):
+        """Remember accepted content; skips the completion-cache lookup and any rejected first attempt next time."""
+        with self._match_memo_lock:
+            self._match_memo[prompt] = (content[0], tuple(content[1]))
+            self._match_memo.move_to_end(prompt)
+            if len(self._match_memo) > MATCH_CONTENT_MEMO_SIZE:
+                self._match_memo.popitem(last=False)
+
+    def _build_match_prompt(
+        self,
+        target_features: _EmployeeFeatures,
+        matched_features: _EmployeeFeatures,
+        shared_skills: list,
+        matching_projects: list,
+        tech_overlap: list
+    ) -> tuple:
+        """Build the Talent Navigator prompt. Also returns the shared architecture patterns for the fallback."""
+
+        target_json = self._match_profile_json(target_features.employee)
+        match_json = self._match_profile_json(matched_features.employee)
+        overlap_json, shared_arch = self._match_overlap_json(target_features, matched_features, shared_skills, matching_projects, tech_overlap)
 
         full_payload = {
             "target": target_json,
@@ -718,70 +1489,198 @@ Here is your input JSON:
 ```json
 {json.dumps(full_payload, indent=2)}
 """
-        # ---- CALL THE MODEL ----
-        try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,              # Low temperature for strictness
-                    response_mime_type="application/json"
-                )
+        return prompt, shared_arch
+
+    def _build_batch_match_prompt(self, target_features: _EmployeeFeatures, candidates: List[Tuple[_EmployeeFeatures, dict]]) -> str:
+        """Talent Navigator prompt covering every (candidate, overlap details) pair, with the target sent once."""
+        candidates_json = []
+        for features, details in candidates:
+            overlap_json, _ = self._match_overlap_json(
+                target_features, features, details["shared_skills"], details["matching_projects"], details["tech_overlap"]
             )
+            candidates_json.append({
+                "id": features.employee.id,
+                "match": self._match_profile_json(features.employee),
+                "overlap": overlap_json
+            })
 
-            content = response.text.strip()
-            parsed = json.loads(content)
+        full_payload = {
+            "target": self._match_profile_json(target_features.employee),
+            "candidates": candidates_json
+        }
 
-            reason_summary = parsed.get("reasonSummary", "")
-            collab_suggestions = parsed.get("collaborationSuggestions", [])
+        return f"""
+You are Talent Navigator, an expert in engineering collaboration, technical synergy analysis, and organizational development.
 
-            # ---- VALIDATION LOGIC ----
-            is_valid = True
-            if not reason_summary or len(reason_summary) < 10:
-                is_valid = False
-            
-            forbidden_phrases = ["both have expertise", "discuss shared interests", "similar areas", "good match"]
-            if any(phrase in reason_summary.lower() for phrase in forbidden_phrases):
-                print(f"LLM returned generic reason: '{reason_summary}'. Triggering fallback.")
-                is_valid = False
+You will receive STRICT structured JSON with real project descriptions, tech stacks, and overlap information for one target and several candidates.  
+You MUST use only the provided fields. No assumptions. No invented skills or projects.
 
-            if not is_valid:
-                raise ValueError("Generated content failed validation checks.")
+Your job, for EACH candidate:
+1. Produce a highly specific 1–2 sentence match reason.
+2. Produce 2–3 deeply actionable collaboration ideas tied directly to shared engineering context.
 
-            return reason_summary, collab_suggestions[:3]
+Forbidden:
+- generic statements (“Both have frontend expertise”)
+- vague suggestions (“discuss shared interests”)
+- invented data
 
-        except Exception as e:
-            print(f"[ERROR] generate_llm_match_content failed or rejected: {e}")
+Required output format (one entry per candidate id):
+{{
+  "<candidate id>": {{
+    "reasonSummary": "...",
+    "collaborationSuggestions": ["...", "...", "..."]
+  }}
+}}
 
-            # ---- DETERMINISTIC FALLBACK ----
-            # Build a specific reason from the extracted data
-            if shared_arch:
-                fallback_reason = f"Both engineers work with {shared_arch[0]} architectures, creating a strong foundation for technical collaboration."
-            elif matching_projects:
-                fallback_reason = f"Shared experience in {matching_projects[0]} domains suggests high potential for knowledge exchange."
-            elif tech_overlap:
-                fallback_reason = f"Strong technical alignment on {', '.join(tech_overlap[:3])} enables immediate collaboration on codebases."
-            else:
-                fallback_reason = "Complementary skill sets with potential for cross-functional collaboration."
-
-            fallback_collab = []
-            if shared_arch:
-                fallback_collab.append(f"Co-design systems using {shared_arch[0]} patterns.")
-            if tech_overlap:
-                fallback_collab.append(f"Pair program on complex {tech_overlap[0]} modules.")
-            if matching_projects:
-                fallback_collab.append(f"Share insights on {matching_projects[0]} challenges.")
-            
-            # Fill remaining suggestions
-            if len(fallback_collab) < 2:
-                fallback_collab.append("Conduct code reviews to share best practices.")
-                fallback_collab.append("Discuss architectural trade-offs in recent projects.")
+Here is your input JSON:
+```json
+{json.dumps(full_payload, indent=2)}
+"""
 
-            return fallback_reason, fallback_collab[:3]
+    def _match_profile_json(self, emp: Employee) -> dict:
+        """Profile fields sent to the match-content prompt."""
+        def project_to_dict(p):
+            return {
+                "name": p.name,
+                "description": getattr(p, "description", ""),
+                "tech": getattr(p, "tech", [])
+            }
+
+        return {
+            "name": emp.name,
+            "role": emp.profile.role,
+            "skills": emp.profile.skills[:15], # Increased limit
+            "projects": [project_to_dict(p) for p in emp.profile.projects],
+            "department": emp.profile.department,
+            "seniority": emp.profile.seniority,
+        }
+
+    def _match_overlap_json(
+        self,
+        target_features: _EmployeeFeatures,
+        match_features: _EmployeeFeatures,
+        shared_skills: list,
+        matching_projects: list,
+        tech_overlap: list
+    ) -> tuple:
+        """Overlap block of the match-content prompt, plus the shared architecture patterns for the fallback."""
+        
+        shared_arch = sorted(target_features.architecture_patterns & match_features.architecture_patterns)
+        shared_tooling = sorted(target_features.tooling_patterns & match_features.tooling_patterns)
+
+        overlap_json = {
+            "sharedSkills": shared_skills,
+            "sharedTech": tech_overlap,
+            "projectDomainOverlap": matching_projects,
+            "architecturePatterns": shared_arch,
+            "toolingOverlap": shared_tooling,
+            "matchingSeniority": target_features.employee.profile.seniority == match_features.employee.profile.seniority,
+        }
+        return overlap_json, shared_arch
+
+    def _build_match_retry_prompt(self, prompt: str, rejected: _RejectedResponse) -> str:
+        """Original match prompt followed by the rejected answer and why it failed."""
+        return (
+            f"{prompt}\n\n"
+            f"Your previous answer was rejected because: {rejected}\n"
+            f"Previous answer: {rejected.response.strip()}\n"
+            "Produce a corrected JSON object that follows every rule above and names concrete shared work."
+        )
+
+    def _validate_match_content(self, text: str) -> tuple:
+        """Parse the LLM JSON response; raises ValueError if it is missing or generic."""
+        return self._validate_match_fields(json.loads(text.strip()))
+
+    def _parse_batch_match_content(self, text: str) -> Dict[str, tuple]:
+        """
+        Parse a batched response into {candidate_id: (reason, suggestions)}.
+        Entries that are missing or fail validation are left out so the caller can retry them one by one.
+        """
+        parsed = json.loads(text.strip())
+        if not isinstance(parsed, dict):
+            raise ValueError("Batched match content is not a JSON object.")
+
+        contents = {}
+        for emp_id, entry in parsed.items():
+            try:
+                contents[emp_id] = self._validate_match_fields(entry)
+            except (ValueError, AttributeError) as e:
+                print(f"[WARN] Batched match content for {emp_id} rejected: {e}")
+        return contents
+
+    def _validate_match_fields(self, parsed: dict) -> tuple:
+        """Check one {reasonSummary, collaborationSuggestions} object; raises ValueError if it is missing or generic."""
+        reason_summary = parsed.get("reasonSummary", "")
+        collab_suggestions = parsed.get("collaborationSuggestions", [])
+
+        # ---- VALIDATION LOGIC ----
+        if not reason_summary or len(reason_summary) < 10:
+            raise ValueError("reasonSummary is missing or shorter than 10 characters")
+        
+        reason_lower = reason_summary.lower()
+        generic = next((phrase for phrase in GENERIC_REASON_PHRASES if phrase in reason_lower), None)
+        if generic:
+            print(f"LLM returned generic reason: '{reason_summary}'. Rejecting response.")
+            raise ValueError(f"reasonSummary uses the generic phrase '{generic}'")
+
+        return reason_summary, collab_suggestions[:3]
+
+    def _fallback_match_content(self, shared_arch: list, matching_projects: list, tech_overlap: list) -> tuple:
+        """Deterministic reason and suggestions used when the LLM call fails or is rejected."""
+        # ---- DETERMINISTIC FALLBACK ----
+        # Build a specific reason from the extracted data
+        if shared_arch:
+            fallback_reason = f"Both engineers work with {shared_arch[0]} architectures, creating a strong foundation for technical collaboration."
+        elif matching_projects:
+            fallback_reason = f"Shared experience in {matching_projects[0]} domains suggests high potential for knowledge exchange."
+        elif tech_overlap:
+            fallback_reason = f"Strong technical alignment on {', '.join(tech_overlap[:3])} enables immediate collaboration on codebases."
+        else:
+            fallback_reason = "Complementary skill sets with potential for cross-functional collaboration."
+
+        fallback_collab = []
+        if shared_arch:
+            fallback_collab.append(f"Co-design systems using {shared_arch[0]} patterns.")
+        if tech_overlap:
+            fallback_collab.append(f"Pair program on complex {tech_overlap[0]} modules.")
+        if matching_projects:
+            fallback_collab.append(f"Share insights on {matching_projects[0]} challenges.")
+        
+        # Fill remaining suggestions
+        if len(fallback_collab) < 2:
+            fallback_collab.append("Conduct code reviews to share best practices.")
+            fallback_collab.append("Discuss architectural trade-offs in recent projects.")
+
+        return fallback_reason, fallback_collab[:3]
 
     
     def generate_collaboration_summary(self, target_emp: Employee, recommendations: List[Dict]) -> str:
+        return "".join(self.stream_collaboration_summary(target_emp, recommendations))
+
+    def stream_collaboration_summary(self, target_emp: Employee, recommendations: List[Dict]) -> Iterator[str]:
+        """
+        Yield the summary text as the model produces it so callers can render incrementally.
+        A cached summary is yielded in one piece; a fresh one is cached once the stream completes.
+        """
         print("Generating AI summary...")
+        prompt = self._build_summary_prompt(target_emp, recommendations)
+        key = CompletionCache.make_key(self.model.model_name, 0.7, prompt)
+        cached = self.completion_cache.get(key)
+        if cached is not None:
+            yield cached
+            return
         
+        try:
+            parts = []
+            response = self.model.generate_content(prompt, generation_config=self._generation_config(0.7, False), stream=True)
+            for chunk in response:
+                parts.append(chunk.text)
+                yield chunk.text
+            self.completion_cache.put(key, self.model.model_name, "".join(parts))
+        except Exception as e:
+            yield f"Error generating summary: {e}"
+
+    def _build_summary_prompt(self, target_emp: Employee, recommendations: List[Dict]) -> str:
         # Prepare context as JSON
         context = {
             "target": {
@@ -821,14 +1720,4 @@ Here is your input JSON:
         - Do NOT reveal scoring algorithms.
         - Output raw text (Markdown supported).
         """
-        
-        try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.7
-                )
-            )
-            return response.text
-        except Exception as e:
-            return f"Error generating summary: {e}"
+        return prompt
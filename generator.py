@@ -1,22 +1,32 @@
 import random
-from faker import Faker
+from typing import Optional
+import numpy as np
 from models import Employee, Profile, Project
 
-fake = Faker()
+# Faker costs ~65ms to import and build, so it is created on first use rather than at import
+_fake = None
 
-ROLES = [
+# Faker dominates generation time, so names come from a pool that fills on demand and is reused once full.
+# Entries are (name, email prefix) so the prefix is formatted once per name, not once per employee.
+NAME_POOL_SIZE = 1000
+_name_pool: list[tuple[str, str]] = []
+# Names in _name_pool, so the pool never holds the same name twice
+_pooled_names: set[str] = set()
+
+# Pools are tuples so they are built once and choices()/sample() index them directly
+ROLES = (
     "Software Engineer", "Senior Software Engineer", "Staff Engineer",
     "Backend Engineer", "Frontend Engineer", "Full Stack Engineer",
     "DevOps Engineer", "Data Engineer", "ML Engineer",
     "Engineering Manager", "Product Manager", "Tech Lead",
     "Designer", "UX Researcher", "QA Engineer"
-]
+)
 
-SENIORITY_LEVELS = ["Junior", "Mid-level", "Senior", "Staff", "Principal"]
-DEPARTMENTS = ["Engineering", "Product", "Design", "Data", "Platform Engineering", "Infrastructure"]
-LOCATIONS = ["San Francisco, CA", "New York, NY", "Seattle, WA", "Austin, TX", "Remote", "Berlin, Germany", "London, UK", "Toronto, Canada"]
+SENIORITY_LEVELS = ("Junior", "Mid-level", "Senior", "Staff", "Principal")
+DEPARTMENTS = ("Engineering", "Product", "Design", "Data", "Platform Engineering", "Infrastructure")
+LOCATIONS = ("San Francisco, CA", "New York, NY", "Seattle, WA", "Austin, TX", "Remote", "Berlin, Germany", "London, UK", "Toronto, Canada")
 
-TECH_SKILLS = [
+TECH_SKILLS = (
     "Python", "Java", "JavaScript", "TypeScript", "Go", "Rust", "C++",
     "React", "Angular", "Vue", "Node.js", "Django", "Flask", "FastAPI",
     "SQL", "PostgreSQL", "MongoDB", "Redis", "Elasticsearch",
@@ -24,15 +34,33 @@ TECH_SKILLS = [
     "Kafka", "RabbitMQ", "GraphQL", "REST API", "gRPC",
     "Machine Learning", "TensorFlow", "PyTorch", "Scikit-learn",
     "Git", "CI/CD", "Jenkins", "GitHub Actions", "Microservices"
-]
+)
 
-TOOLS = [
+TOOLS = (
     "VSCode", "IntelliJ", "Vim", "Jira", "Confluence", "Slack",
     "Figma", "Sketch", "Datadog", "Grafana", "Prometheus",
     "Postman", "Jupyter", "Tableau"
-]
+)
+
+MANAGERS = ("Sarah Thompson", "Michael Chen", "Emily Rodriguez", "David Park", "Lisa Johnson")
+
+# Focus area quoted in each role's professional summary
+DOMAIN_MAP = {
+    "Backend Engineer": "backend development and API design",
+    "Frontend Engineer": "modern frontend frameworks and UI/UX",
+    "Full Stack Engineer": "end-to-end web application development",
+    "DevOps Engineer": "infrastructure automation and cloud deployment",
+    "Data Engineer": "data pipeline development and analytics",
+    "ML Engineer": "machine learning and predictive modeling",
+}
+
+INTERESTS = (
+    "Open Source", "AI/ML", "Cloud Architecture", "DevOps",
+    "Frontend Development", "Backend Systems", "Data Engineering",
+    "Security", "Performance Optimization", "API Design"
+)
 
-PROJECT_TEMPLATES = [
+PROJECT_TEMPLATES = (
     {"name": "Payment Gateway Modernization", "desc": "Migrated legacy payment system to microservices architecture, reducing latency by 40%", "tech_pool": ["Java", "Kubernetes", "Kafka", "PostgreSQL"]},
     {"name": "Real-time Analytics Dashboard", "desc": "Built scalable analytics platform processing 10M events/day", "tech_pool": ["Python", "Kafka", "Elasticsearch", "React"]},
     {"name": "Mobile App Redesign", "desc": "Led complete redesign of iOS/Android apps, increasing user engagement by 35%", "tech_pool": ["React Native", "TypeScript", "GraphQL"]},
@@ -43,59 +71,127 @@ PROJECT_TEMPLATES = [
     {"name": "Data Pipeline Optimization", "desc": "Optimized ETL pipelines, reducing processing time by 60%", "tech_pool": ["Python", "Apache Spark", "Airflow", "AWS"]},
     {"name": "Frontend Component Library", "desc": "Created reusable component library used across 15+ products", "tech_pool": ["React", "TypeScript", "Storybook"]},
     {"name": "Security Audit Platform", "desc": "Built automated security scanning and vulnerability reporting system", "tech_pool": ["Python", "Docker", "PostgreSQL"]},
-]
+)
 
-PROFESSIONAL_SUMMARIES = [
+PROFESSIONAL_SUMMARIES = (
     "{role} with {years} years of experience in {domain}. Passionate about building scalable systems and mentoring junior engineers.",
     "Experienced {role} specializing in {domain}. Strong background in distributed systems and cloud infrastructure.",
     "{role} focused on {domain}. Known for delivering high-quality code and driving technical excellence.",
     "Senior {role} with expertise in {domain}. Led multiple cross-functional teams to successful product launches.",
     "{role} passionate about {domain}. Combines technical depth with strong communication skills."
-]
+)
+
+def _get_faker():
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        # Unweighted providers skip Faker's per-call frequency sampling; the names are synthetic either way
+        _fake = Faker(use_weighting=False)
+    return _fake
+
+def _new_names(count: int, taken: set[str]) -> list[tuple[str, str]]:
+    """`count` Faker names not in `taken` (which is updated), as (name, email prefix) pairs."""
+    fake = _get_faker()
+    names = []
+    while len(names) < count:
+        name = fake.name()
+        if name not in taken:
+            taken.add(name)
+            names.append((name, name.lower().replace(' ', '.')))
+    return names
+
+def _draw_names(rng: random.Random, count: int) -> list[tuple[str, str]]:
+    """
+    `count` distinct (name, email prefix) pairs. Faker only runs until the pool holds NAME_POOL_SIZE names,
+    or for the overflow when one corpus needs more names than the pool has.
+    """
+    global _fake
+    pooled = len(_name_pool)
+    missing = min(count, NAME_POOL_SIZE - pooled)
+    fresh = _new_names(missing, _pooled_names) if missing > 0 else []
+    _name_pool.extend(fresh)
+    # The rest come without replacement from names pooled before this call, so none repeats fresh ones
+    reused = rng.sample(_name_pool[:pooled], min(count - len(fresh), pooled))
+    # Past the pool's size, one-off names (not pooled) distinct from every pooled name
+    overflow = count - len(fresh) - len(reused)
+    extra = _new_names(overflow, set(_pooled_names)) if overflow > 0 else []
+    if len(_name_pool) >= NAME_POOL_SIZE:
+        # Pool is full: Faker is only needed again for oversized corpora, so drop its provider tables
+        _fake = None
+    return fresh + reused + extra
 
-def generate_synthetic_data(count: int = 20) -> list[Employee]:
+def _sample_rows(np_rng: np.random.Generator, pool: tuple, low: int, high: int, count: int) -> list[list]:
+    """
+    `count` rows of between low and high (inclusive) distinct items from pool, drawn in one batch:
+    argsort of a uniform key matrix gives an independent random permutation per row.
+    """
+    sizes = np_rng.integers(low, high + 1, size=count).tolist()
+    order = np.argsort(np_rng.random((count, len(pool))), axis=1).tolist()
+    return [[pool[j] for j in row[:k]] for row, k in zip(order, sizes)]
+
+def generate_synthetic_data(count: int = 20, seed: Optional[int] = None) -> list[Employee]:
+    """
+    `count` synthetic employees. Passing `seed` makes profile draws reproducible; without it the
+    generators are seeded from `random`, so random.seed() has the same effect. Names come from Faker.
+    """
     employees = []
+    # One dedicated generator for every draw, with its methods bound locally for the loop
+    rng = random.Random(seed if seed is not None else random.getrandbits(64))
+    randint = rng.randint
+    sample = rng.sample
+    
+    # Draw every per-employee scalar up front: one C-level call per field instead of one per employee
+    names = _draw_names(rng, count)
+    roles = rng.choices(ROLES, k=count)
+    seniorities = rng.choices(SENIORITY_LEVELS, k=count)
+    departments = rng.choices(DEPARTMENTS, k=count)
+    locations = rng.choices(LOCATIONS, k=count)
+    managers = rng.choices(MANAGERS, k=count)
+    experience = rng.choices(range(2, 16), k=count)
+    summary_templates = rng.choices(PROFESSIONAL_SUMMARIES, k=count)
+    email_suffixes = rng.choices(range(1, 1000), k=count)
+    
+    # Variable-size draws without replacement, vectorized across all employees
+    np_rng = np.random.default_rng(rng.getrandbits(64))
+    skill_rows = _sample_rows(np_rng, TECH_SKILLS, 6, 12, count)
+    tool_rows = _sample_rows(np_rng, TOOLS, 3, 6, count)
+    interest_rows = _sample_rows(np_rng, INTERESTS, 2, 4, count)
+    project_rows = _sample_rows(np_rng, PROJECT_TEMPLATES, 2, 4, count)
+    # Refilled per employee; format_map reads it directly instead of packing fresh kwargs each time
+    summary_fields = {}
     
     for i in range(count):
         # Basic info
-        name = fake.name()
-        role = random.choice(ROLES)
-        seniority = random.choice(SENIORITY_LEVELS)
-        department = random.choice(DEPARTMENTS)
-        location = random.choice(LOCATIONS)
-        email = f"{name.lower().replace(' ', '.')}.{random.randint(1, 999)}@company.com"
+        name, email_prefix = names[i]
+        role = roles[i]
+        seniority = seniorities[i]
+        department = departments[i]
+        location = locations[i]
+        email = f"{email_prefix}.{email_suffixes[i]}@company.com"
         
         # Manager (pick from common manager names)
-        managers = ["Sarah Thompson", "Michael Chen", "Emily Rodriguez", "David Park", "Lisa Johnson"]
-        manager = random.choice(managers)
+        manager = managers[i]
         
         # Experience
-        experience_years = random.randint(2, 15)
+        experience_years = experience[i]
         
         # Skills
-        num_skills = random.randint(6, 12)
-        skills = random.sample(TECH_SKILLS, num_skills)
+        skills = skill_rows[i]
         primary_skills = skills[:4]
         secondary_skills = skills[4:8] if len(skills) > 4 else []
         
         # Tools
-        tools = random.sample(TOOLS, random.randint(3, 6))
+        tools = tool_rows[i]
         
         # Interests
-        interests = random.sample([
-            "Open Source", "AI/ML", "Cloud Architecture", "DevOps",
-            "Frontend Development", "Backend Systems", "Data Engineering",
-            "Security", "Performance Optimization", "API Design"
-        ], k=random.randint(2, 4))
+        interests = interest_rows[i]
         
         # Projects (2-4 per employee)
-        num_projects = random.randint(2, 4)
-        project_samples = random.sample(PROJECT_TEMPLATES, num_projects)
         projects = []
-        for proj_template in project_samples:
+        for proj_template in project_rows[i]:
             # Randomize tech stack from the pool
-            num_tech = min(random.randint(2, 4), len(proj_template["tech_pool"]))
-            tech_stack = random.sample(proj_template["tech_pool"], num_tech)
+            num_tech = min(randint(2, 4), len(proj_template["tech_pool"]))
+            tech_stack = sample(proj_template["tech_pool"], num_tech)
             projects.append(Project(
                 name=proj_template["name"],
                 description=proj_template["desc"],
@@ -103,27 +199,18 @@ def generate_synthetic_data(count: int = 20) -> list[Employee]:
             ))
         
         # Professional summary
-        domain_map = {
-            "Backend Engineer": "backend development and API design",
-            "Frontend Engineer": "modern frontend frameworks and UI/UX",
-            "Full Stack Engineer": "end-to-end web application development",
-            "DevOps Engineer": "infrastructure automation and cloud deployment",
-            "Data Engineer": "data pipeline development and analytics",
-            "ML Engineer": "machine learning and predictive modeling",
-        }
-        domain = domain_map.get(role, "software development and system design")
-        summary_template = random.choice(PROFESSIONAL_SUMMARIES)
-        professional_summary = summary_template.format(
-            role=role,
-            years=experience_years,
-            domain=domain
-        )
+        summary_fields["role"] = role
+        summary_fields["years"] = experience_years
+        summary_fields["domain"] = DOMAIN_MAP.get(role, "software development and system design")
+        professional_summary = summary_templates[i].format_map(summary_fields)
         
-        # Create raw text for embedding
-        raw_text = f"{name} is a {role} with {experience_years} years of experience. "
-        raw_text += f"Expert in {', '.join(primary_skills[:3])}. "
-        raw_text += f"Recently worked on: {', '.join([p.name for p in projects])}. "
-        raw_text += professional_summary
+        # Create raw text for embedding (one f-string, no intermediate concatenations)
+        raw_text = (
+            f"{name} is a {role} with {experience_years} years of experience. "
+            f"Expert in {', '.join(primary_skills[:3])}. "
+            f"Recently worked on: {', '.join([p.name for p in projects])}. "
+            f"{professional_summary}"
+        )
         
         # Create profile
         profile = Profile(
@@ -9,8 +9,18 @@ load_dotenv()
 from engine import CollabEngine
 from models import Employee, Profile
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is used when it is missing
+    orjson = None
+
+def dumps_json(data) -> str:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str).decode()
+    return json.dumps(data, indent=2, default=str)
+
 def print_json(data):
-    print(json.dumps(data, indent=2, default=str))
+    print(dumps_json(data))
 
 def main():
     print("Welcome to CollabConnect (AI Powered)!")
@@ -25,6 +35,8 @@ def main():
 
     engine = CollabEngine(api_key=api_key)
     employees = []
+    # Lowercased full name -> first employee with that name, rebuilt whenever data is generated
+    name_index = {}
 
     while True:
         print("\nAvailable commands:")
@@ -39,11 +51,14 @@ def main():
             count = int(count) if count.isdigit() else 30
             employees = generate_synthetic_data(count)
             engine.load_employees(employees)
+            name_index = {}
+            for emp in employees:
+                name_index.setdefault(emp.name.lower(), emp)
             print(f"Generated and loaded {len(employees)} profiles.")
             
             # Save to file for inspection
             with open("synthetic_employees.json", "w") as f:
-                json.dump([e.to_dict() for e in employees], f, indent=2)
+                f.write(dumps_json([e.to_dict() for e in employees]))
             print("Saved to synthetic_employees.json")
 
         elif choice == "2":
@@ -58,11 +73,11 @@ def main():
             
             query = input("Enter Name or ID: ").strip()
             
-            target_emp = None
-            for emp in employees:
-                if emp.id == query or query.lower() in emp.name.lower():
-                    target_emp = emp
-                    break
+            # Exact ID or full name first (dict hits); partial names fall back to a scan
+            query_lower = query.lower()
+            target_emp = engine.get_employee(query) or name_index.get(query_lower)
+            if target_emp is None:
+                target_emp = next((emp for emp in employees if query_lower in emp.name.lower()), None)
             
             if target_emp:
                 print(f"\nFinding matches for: {target_emp.name} ({target_emp.profile.role})")
@@ -87,8 +102,9 @@ def main():
                 
                 # Narrative Output
                 print("\n--- Narrative Summary ---")
-                summary = engine.generate_collaboration_summary(target_emp, recommendations)
-                print(summary)
+                for chunk in engine.stream_collaboration_summary(target_emp, recommendations):
+                    print(chunk, end="", flush=True)
+                print()
             else:
                 print("Employee not found.")
 
@@ -1,22 +1,23 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     name: str
     description: str
     tech: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class ResumeMatch:
-    shared_skills: List[str] = field(default_factory=list)
-    matching_projects: List[str] = field(default_factory=list)
-    matching_domains: List[str] = field(default_factory=list)
-    tech_overlap: List[str] = field(default_factory=list)
+    # Assigned wholesale, never appended to, so empty tuples avoid allocating four lists per instance
+    shared_skills: Tuple[str, ...] = ()
+    matching_projects: Tuple[str, ...] = ()
+    matching_domains: Tuple[str, ...] = ()
+    tech_overlap: Tuple[str, ...] = ()
     matching_seniority: bool = False
     reason_summary: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
     role: str
     seniority: str
@@ -32,7 +33,7 @@ class Profile:
     primary_skills: List[str] = field(default_factory=list)
     secondary_skills: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class Employee:
     id: str
     name: str
@@ -42,12 +43,33 @@ class Employee:
     embedding: Optional[List[float]] = None
     resume_match: Optional[ResumeMatch] = None
     collaboration_suggestions: List[str] = field(default_factory=list)
+    # Serialized profile, built on the first to_dict(); profiles are not edited after generation/parsing
+    _profile_dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
 
-    def to_dict(self):
+    def _build_profile_dict(self) -> Dict:
         projects_dict = [
             {"name": p.name, "description": p.description, "tech": p.tech}
             for p in self.profile.projects
         ]
+        return {
+            "role": self.profile.role,
+            "seniority": self.profile.seniority,
+            "department": self.profile.department,
+            "location": self.profile.location,
+            "manager": self.profile.manager,
+            "experienceYears": self.profile.experience_years,
+            "professionalSummary": self.profile.professional_summary,
+            "skills": self.profile.skills,
+            "tools": self.profile.tools,
+            "projects": projects_dict,
+            "interests": self.profile.interests,
+            "primarySkills": self.profile.primary_skills,
+            "secondarySkills": self.profile.secondary_skills
+        }
+
+    def to_dict(self):
+        if self._profile_dict is None:
+            self._profile_dict = self._build_profile_dict()
         
         resume_match_dict = None
         if self.resume_match:
@@ -64,22 +86,53 @@ class Employee:
             "id": self.id,
             "name": self.name,
             "email": self.email,
-            "profile": {
-                "role": self.profile.role,
-                "seniority": self.profile.seniority,
-                "department": self.profile.department,
-                "location": self.profile.location,
-                "manager": self.profile.manager,
-                "experienceYears": self.profile.experience_years,
-                "professionalSummary": self.profile.professional_summary,
-                "skills": self.profile.skills,
-                "tools": self.profile.tools,
-                "projects": projects_dict,
-                "interests": self.profile.interests,
-                "primarySkills": self.profile.primary_skills,
-                "secondarySkills": self.profile.secondary_skills
-            },
+            "profile": self._profile_dict,
             "resumeMatch": resume_match_dict,
             "collaborationSuggestions": self.collaboration_suggestions
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Employee":
+        """Inverse of to_dict; also reads an optional "rawText" key, which to_dict leaves out."""
+        p = data["profile"]
+        profile = Profile(
+            role=p["role"],
+            seniority=p["seniority"],
+            department=p["department"],
+            location=p.get("location", ""),
+            manager=p.get("manager", ""),
+            experience_years=p.get("experienceYears", 0),
+            professional_summary=p.get("professionalSummary", ""),
+            skills=p.get("skills", []),
+            tools=p.get("tools", []),
+            projects=[
+                Project(name=proj["name"], description=proj["description"], tech=proj.get("tech", []))
+                for proj in p.get("projects", [])
+            ],
+            interests=p.get("interests", []),
+            primary_skills=p.get("primarySkills", []),
+            secondary_skills=p.get("secondarySkills", [])
+        )
+        
+        resume_match = None
+        rm = data.get("resumeMatch")
+        if rm:
+            resume_match = ResumeMatch(
+                shared_skills=tuple(rm.get("sharedSkills", ())),
+                matching_projects=tuple(rm.get("matchingProjects", ())),
+                matching_domains=tuple(rm.get("matchingDomains", ())),
+                tech_overlap=tuple(rm.get("techOverlap", ())),
+                matching_seniority=rm.get("matchingSeniority", False),
+                reason_summary=rm.get("reasonSummary", "")
+            )
+        
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            email=data["email"],
+            profile=profile,
+            raw_text=data.get("rawText", ""),
+            resume_match=resume_match,
+            collaboration_suggestions=data.get("collaborationSuggestions", [])
+        )
+
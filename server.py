@@ -1,26 +1,51 @@
+import asyncio
+import json
 import os
-import sys
-# Monkeypatch for Python < 3.10 compatibility
-if sys.version_info < (3, 10):
-    try:
-        import importlib.metadata
-        import importlib_metadata
-        if not hasattr(importlib.metadata, "packages_distributions"):
-            importlib.metadata.packages_distributions = importlib_metadata.packages_distributions
-    except ImportError:
-        pass
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
+from cache import SemanticCache
 from engine import CollabEngine
 from generator import generate_synthetic_data
-from models import Employee
+from models import Employee, Profile, Project
 from fastapi.middleware.cors import CORSMiddleware
 
 load_dotenv()
 
-app = FastAPI()
+# Synthetic corpus saved between restarts, so the same employees come back and their embeddings hit the cache
+CORPUS_CACHE_PATH = os.getenv("CORPUS_CACHE_PATH", "corpus_cache.json")
+# Bump when the saved employee shape or the generator changes, so older files are regenerated instead of loaded
+CORPUS_FORMAT_VERSION = 1
+CORPUS_SIZE = 30
+# Resume/profile requests whose text embeds within this cosine similarity of a recent one reuse its response
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+# Between this and SEMANTIC_CACHE_THRESHOLD the search is rerun but the cached parse and match content are reused (no LLM)
+SEMANTIC_CACHE_APPROX_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_APPROX_THRESHOLD", "0.85"))
+SEMANTIC_CACHE_SIZE = 512
+
+# Set once the corpus embeddings are loaded; endpoints that search wait on it
+embeddings_ready = asyncio.Event()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Embed in the background so the server (and /health) answer while profiles load
+    async def load():
+        try:
+            await engine.load_employees_async(employees)
+            print("Data loaded.")
+        finally:
+            embeddings_ready.set()
+    app.state.embedding_load = asyncio.create_task(load())
+    # Connection setup for the query-time clients happens alongside, off the request path
+    app.state.warmup = asyncio.create_task(engine.warmup_async())
+    yield
+    app.state.embedding_load.cancel()
+    app.state.warmup.cancel()
+
+app = FastAPI(lifespan=lifespan)
 
 # Allow CORS for frontend
 app.add_middleware(
@@ -39,26 +64,66 @@ else:
     print("API Key NOT loaded from env")
 engine = CollabEngine(api_key=api_key)
 
+def load_corpus(count: int) -> List[Employee]:
+    """Employees saved by a previous run if the file matches the format version and `count`, else a freshly generated (and saved) set."""
+    if os.path.exists(CORPUS_CACHE_PATH):
+        try:
+            with open(CORPUS_CACHE_PATH, "r") as f:
+                saved = json.load(f)
+            if saved.get("version") == CORPUS_FORMAT_VERSION and len(saved.get("employees", [])) == count:
+                employees = [Employee.from_dict(data) for data in saved["employees"]]
+                print(f"Loaded {len(employees)} employees from {CORPUS_CACHE_PATH}")
+                return employees
+            print(f"[WARN] {CORPUS_CACHE_PATH} is from another format version or corpus size, regenerating")
+        except Exception as e:
+            print(f"[WARN] Could not read {CORPUS_CACHE_PATH}, regenerating: {e}")
+    
+    generated = generate_synthetic_data(count)
+    # Same shape as to_dict (what main.py saves), plus the raw text the embeddings are computed from
+    payload = {
+        "version": CORPUS_FORMAT_VERSION,
+        "employees": [{**emp.to_dict(), "rawText": emp.raw_text} for emp in generated]
+    }
+    # Write then rename, so an interrupted save never leaves a truncated file behind
+    tmp_path = f"{CORPUS_CACHE_PATH}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, CORPUS_CACHE_PATH)
+    except Exception as e:
+        # A read-only or full disk only costs the next start a regeneration
+        print(f"[WARN] Could not save {CORPUS_CACHE_PATH}, continuing with the in-memory corpus: {e}")
+    return generated
+
 # Load initial data
 print("Loading synthetic data...")
-employees = generate_synthetic_data(30)
+employees = load_corpus(CORPUS_SIZE)
 print("Generated Employees:")
 for emp in employees[:5]:
     print(f"- {emp.name}")
-engine.load_employees(employees)
-print("Data loaded.")
+
+response_cache = SemanticCache(max_entries=SEMANTIC_CACHE_SIZE)
+# Semantic cache lookups by outcome, reported on /health
+response_cache_stats = {"exact": 0, "approximate": 0, "miss": 0}
 
 class RecommendRequest(BaseModel):
     resumeText: Optional[str] = None
     searchQuery: Optional[str] = None
     mode: str = "resume"  # "resume" or "search"
+    # Resume/profile mode only: stream NDJSON, one recommendation per line as each match finishes
+    stream: bool = False
+    # Skip the semantic response cache (debugging)
+    cache_bypass: bool = False
 
+# Response models are frozen: cards and whole responses are cached and shared between requests
 class ProjectResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
     name: str
     description: str
     tech: List[str]
 
 class ResumeMatchResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
     sharedSkills: List[str]
     matchingProjects: List[str]
     matchingDomains: List[str]
@@ -67,6 +132,7 @@ class ResumeMatchResponse(BaseModel):
     reasonSummary: str
 
 class Recommendation(BaseModel):
+    model_config = ConfigDict(frozen=True)
     id: str
     name: str
     title: str
@@ -85,180 +151,172 @@ class Recommendation(BaseModel):
     summary: str
     avatarUrl: str
     resumeMatch: Optional[ResumeMatchResponse] = None
-    resumeMatch: Optional[ResumeMatchResponse] = None
     collaborationSuggestions: List[str] = []
     whyMatched: List[str] = []
 
 class RecommendResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
     recommendations: List[Recommendation]
 
+# Per-employee cards holding the fields that never change after load; built and validated once, then copied per response
+_base_cards: Dict[str, Recommendation] = {}
+
+def _base_card(emp: Employee) -> Recommendation:
+    card = _base_cards.get(emp.id)
+    if card is None:
+        card = Recommendation(
+            id=emp.id,
+            name=emp.name,
+            title=emp.profile.role,
+            department=emp.profile.department,
+            location=emp.profile.location,
+            email=emp.email,
+            manager=emp.profile.manager,
+            experienceYears=emp.profile.experience_years,
+            professionalSummary=emp.profile.professional_summary,
+            skills=emp.profile.skills,
+            primarySkills=emp.profile.primary_skills,
+            secondarySkills=emp.profile.secondary_skills,
+            tools=emp.profile.tools,
+            projects=[
+                ProjectResponse(name=p.name, description=p.description, tech=p.tech)
+                for p in emp.profile.projects
+            ],
+            matchScore=0.0,
+            summary="",
+            avatarUrl=f"https://ui-avatars.com/api/?name={emp.name.replace(' ', '+')}&background=random"
+        )
+        _base_cards[emp.id] = card
+    return card
+
+def _resume_match_response(match_details: dict) -> ResumeMatchResponse:
+    return ResumeMatchResponse(
+        sharedSkills=match_details['shared_skills'],
+        matchingProjects=match_details['matching_projects'],
+        matchingDomains=match_details['matching_domains'],
+        techOverlap=match_details['tech_overlap'],
+        matchingSeniority=match_details['matching_seniority'],
+        reasonSummary=match_details['reason_summary']
+    )
+
+def _build_recommendation(rec: dict, match_details: Optional[dict], why_matched: List[str]) -> Recommendation:
+    """Recommendation card for a ranked employee; without match details (name search) the reasons become the summary."""
+    if match_details is None:
+        per_request = {
+            "summary": " • ".join(why_matched),
+            "resumeMatch": None,
+            "collaborationSuggestions": []
+        }
+    else:
+        per_request = {
+            "summary": match_details['reason_summary'],
+            "resumeMatch": _resume_match_response(match_details),
+            "collaborationSuggestions": match_details['collaboration_suggestions']
+        }
+    
+    # The base card was validated when cached; only the per-request fields are set on the copy
+    return _base_card(rec['employee']).model_copy(update={
+        **per_request,
+        "matchScore": rec['score'],
+        "whyMatched": why_matched
+    })
+
+async def _stream_recommendations(target_profile: Employee, recommendations: List[dict]):
+    """NDJSON lines, one per candidate in the order its LLM match content completes (clients sort by matchScore)."""
+    matched_emps = [rec['employee'] for rec in recommendations]
+    async for idx, match_details in engine.generate_detailed_matches_as_completed(target_profile, matched_emps):
+        yield _build_recommendation(recommendations[idx], match_details, []).model_dump_json() + "\n"
+
+async def _approximate_response(parsed_profile: dict, cached: RecommendResponse, raw_text: str, query_embedding) -> RecommendResponse:
+    """
+    A fresh embedding search for the new query that reuses a near-miss cached response's parse and LLM results:
+    candidates the cached response covered keep its match content, new ones get heuristic match details.
+    """
+    target_profile = Employee(
+        id="target_user",
+        name="Candidate",
+        email="candidate@example.com",
+        profile=_profile_from_parsed(parsed_profile),
+        raw_text=raw_text
+    )
+    
+    recommendations = engine.find_similar_employees_by_embedding(query_embedding)
+    cached_cards = {card.id: card for card in cached.recommendations}
+    new_recs = [rec for rec in recommendations if rec['employee'].id not in cached_cards]
+    match_details_list = await engine.generate_detailed_matches_async(
+        target_profile, [rec['employee'] for rec in new_recs], use_llm=False
+    )
+    new_cards = {
+        rec['employee'].id: _build_recommendation(rec, match_details, [])
+        for rec, match_details in zip(new_recs, match_details_list)
+    }
+    
+    # Cached content was written for the same parsed profile and candidate, so only the score is new
+    return RecommendResponse(recommendations=[
+        cached_cards[rec['employee'].id].model_copy(update={"matchScore": rec['score']})
+        if rec['employee'].id in cached_cards else new_cards[rec['employee'].id]
+        for rec in recommendations
+    ])
+
+def _profile_from_parsed(parsed_profile: dict) -> Profile:
+    """Target Profile from parse_profile_from_text output, with the same fallbacks for missing keys."""
+    return Profile(
+        role=parsed_profile.get("role", "Unknown"),
+        department=parsed_profile.get("department", "Unknown"),
+        seniority=parsed_profile.get("seniority", "Unknown"),
+        skills=parsed_profile.get("skills", []),
+        projects=[
+            Project(name=p.get('name', 'Unknown Project'), description=p.get('description', ''), tech=p.get('tech', []))
+            for p in parsed_profile.get("projects", [])
+        ]
+    )
+
+def _query_profile(text: str) -> Profile:
+    """Target Profile for a free-text query: the known skills it mentions stand in for its skills."""
+    return Profile(role='Search Context', department='Unknown', seniority='Unknown', skills=engine.extract_known_skills(text))
+
 @app.post("/api/recommend", response_model=RecommendResponse)
 async def recommend(request: RecommendRequest):
+    await embeddings_ready.wait()
     if request.mode == "search":
         if not request.searchQuery:
             raise HTTPException(status_code=400, detail="Search query is required for search mode")
             
-        # Check for "Typed Background Profile" (Heuristic: > 8 words)
+        # Check for "Typed Background Profile" (Heuristic: > 8 words); it goes through the resume flow below
         is_typed_background = len(request.searchQuery.split()) > 8
         
-        if is_typed_background:
-            print(f"Typed background detected (len={len(request.searchQuery.split())}). Switching to profile mode.")
-            # Treat as resume/profile
-            raw_text = request.searchQuery
-            
-            # Parse structured data
-            parsed_profile = engine.parse_profile_from_text(raw_text)
-            
-            # Create target profile object
-            # Mock Project objects for compatibility
-            mock_projects = []
-            for p in parsed_profile.get("projects", []):
-                mock_p = type('obj', (object,), {
-                    'name': p.get('name', 'Unknown Project'), 
-                    'description': p.get('description', ''), 
-                    'tech': p.get('tech', [])
-                })
-                mock_projects.append(mock_p)
-
-            target_profile = Employee(
-                id="typed_search_user",
-                name="Search User",
-                email="user@example.com",
-                profile=type('obj', (object,), {
-                    'role': parsed_profile.get("role", "Unknown"), 
-                    'department': parsed_profile.get("department", "Unknown"), 
-                    'seniority': parsed_profile.get("seniority", "Unknown"),
-                    'skills': parsed_profile.get("skills", []), 
-                    'projects': mock_projects, 
-                    'interests': []
-                }),
-                raw_text=raw_text
-            )
-            
-            # Use embedding search on the text
-            recommendations = engine.find_similar_employees_by_text(raw_text)
-            
-            # Proceed to parallel detailed match generation (shared logic below)
-            # We need to jump to the parallel execution block. 
-            # To avoid code duplication, we can set a flag or structure the code to fall through.
-            # But since we are inside an if/else block, we'll duplicate the parallel execution logic for clarity 
-            # or refactor. Given the constraints, duplication with a shared helper function is safest if possible,
-            # but defining a helper inside `recommend` is easier.
-            
-        else:
+        if not is_typed_background:
             # Standard Keyword/Short Search
-            recommendations = engine.search_employees(request.searchQuery)
+            recommendations = await engine.search_employees_async(request.searchQuery)
             
             # Create temp target profile from query for detailed matching
             target_profile = Employee(
                 id="search_query",
                 name="Search Query",
                 email="search@example.com",
-                profile=type('obj', (object,), {
-                    'role': 'Search Context', 
-                    'department': 'Unknown', 
-                    'seniority': 'Unknown',
-                    'skills': request.searchQuery.split(), # Treat query terms as skills
-                    'projects': [], 
-                    'interests': []
-                }),
+                profile=_query_profile(request.searchQuery),
                 raw_text=request.searchQuery
             )
             
-            # For standard search, we might skip the heavy LLM detailed match for speed, 
-            # BUT the user wants "Why Recommended" to be high quality.
-            # The current implementation does a "FAST mode - no LLM" for standard search (line 124 in original).
-            # We should keep that for short queries to be fast.
-            
-            response_list = []
-            for rec in recommendations:
-                emp = rec['employee']
-                # Fast match (heuristic)
-                match_details = engine.generate_detailed_match(target_profile, emp, use_llm=False)
-                
-                resume_match = ResumeMatchResponse(
-                    sharedSkills=match_details['shared_skills'],
-                    matchingProjects=match_details['matching_projects'],
-                    matchingDomains=match_details['matching_domains'],
-                    techOverlap=match_details['tech_overlap'],
-                    matchingSeniority=match_details['matching_seniority'],
-                    reasonSummary=match_details['reason_summary']
-                )
-                
-                projects_response = [
-                    ProjectResponse(name=p.name, description=p.description, tech=p.tech)
-                    for p in emp.profile.projects
-                ]
-                
-                response_list.append(Recommendation(
-                    id=emp.id,
-                    name=emp.name,
-                    title=emp.profile.role,
-                    department=emp.profile.department,
-                    location=emp.profile.location,
-                    email=emp.email,
-                    manager=emp.profile.manager,
-                    experienceYears=emp.profile.experience_years,
-                    professionalSummary=emp.profile.professional_summary,
-                    skills=emp.profile.skills,
-                    primarySkills=emp.profile.primary_skills,
-                    secondarySkills=emp.profile.secondary_skills,
-                    tools=emp.profile.tools,
-                    projects=projects_response,
-                    matchScore=rec['score'],
-                    summary=match_details['reason_summary'],
-                    avatarUrl=f"https://ui-avatars.com/api/?name={emp.name.replace(' ', '+')}&background=random",
-                    resumeMatch=resume_match,
-                    collaborationSuggestions=match_details['collaboration_suggestions'],
-                    whyMatched=rec['whyMatched']
-                ))
-            return RecommendResponse(recommendations=response_list)
+            # Short queries keep the fast heuristic match (no LLM)
+            match_details_list = await engine.generate_detailed_matches_async(
+                target_profile, [rec['employee'] for rec in recommendations], use_llm=False
+            )
+            return RecommendResponse(recommendations=[
+                _build_recommendation(rec, match_details, rec['whyMatched'])
+                for rec, match_details in zip(recommendations, match_details_list)
+            ])
+        
+        print(f"Typed background detected (len={len(request.searchQuery.split())}). Switching to profile mode.")
 
     elif request.mode == "name_search":
         if not request.searchQuery:
             raise HTTPException(status_code=400, detail="Search query is required for name search mode")
             
         recommendations = engine.search_employees_by_name(request.searchQuery)
-        
-        response_list = []
-        for rec in recommendations:
-            emp = rec['employee']
-            projects_response = [
-                ProjectResponse(name=p.name, description=p.description, tech=p.tech)
-                for p in emp.profile.projects
-            ]
-            
-            response_list.append(Recommendation(
-                id=emp.id,
-                name=emp.name,
-                title=emp.profile.role,
-                department=emp.profile.department,
-                location=emp.profile.location,
-                email=emp.email,
-                manager=emp.profile.manager,
-                experienceYears=emp.profile.experience_years,
-                professionalSummary=emp.profile.professional_summary,
-                skills=emp.profile.skills,
-                primarySkills=emp.profile.primary_skills,
-                secondarySkills=emp.profile.secondary_skills,
-                tools=emp.profile.tools,
-                projects=projects_response,
-                matchScore=rec['score'],
-                summary=" • ".join(rec['whyMatched']),
-                avatarUrl=f"https://ui-avatars.com/api/?name={emp.name.replace(' ', '+')}&background=random",
-                resumeMatch=None,
-                collaborationSuggestions=[],
-                whyMatched=rec['whyMatched']
-            ))
-        return RecommendResponse(recommendations=response_list)
-
-    else:
-        # Default to Resume Mode (or Typed Background fall-through)
-        # If we fell through from "is_typed_background", we need to handle it here.
-        # But we can't easily fall through from the `if` block above without refactoring.
-        # So we'll handle the "Resume Mode" logic here and copy it for the typed background case above?
-        # No, better to unify.
-        pass
+        return RecommendResponse(recommendations=[
+            _build_recommendation(rec, None, rec['whyMatched']) for rec in recommendations
+        ])
 
     # ---- UNIFIED RESUME / TYPED BACKGROUND LOGIC ----
     # If we are here, it's either explicit resume mode OR typed background mode.
@@ -271,106 +329,80 @@ async def recommend(request: RecommendRequest):
         raise HTTPException(status_code=400, detail="Resume text is required")
 
     # Parse structured data (Improved for BOTH resume and typed background)
-    parsed_profile = engine.parse_profile_from_text(raw_text)
-    
-    mock_projects = []
-    for p in parsed_profile.get("projects", []):
-        mock_p = type('obj', (object,), {
-            'name': p.get('name', 'Unknown Project'), 
-            'description': p.get('description', ''), 
-            'tech': p.get('tech', [])
-        })
-        mock_projects.append(mock_p)
+    # It only needs the raw text, so it starts now and overlaps the cache lookup and the embedding search
+    parse = asyncio.ensure_future(engine.parse_profile_from_text_async(raw_text))
 
+    # Near-duplicate resumes reuse a recent response and skip parsing and every LLM call
+    query_embedding = None
+    if not request.stream and not request.cache_bypass:
+        try:
+            query_embedding = await engine.embed_query_async(raw_text)
+        except Exception as e:
+            print(f"[WARN] Semantic cache lookup skipped: {e}")
+        if query_embedding is not None:
+            cached, similarity = response_cache.nearest(query_embedding, SEMANTIC_CACHE_APPROX_THRESHOLD)
+            if cached is not None:
+                # Both kinds of hit reuse the cached parse
+                parse.cancel()
+            if cached is not None and similarity >= SEMANTIC_CACHE_THRESHOLD:
+                response_cache_stats["exact"] += 1
+                print("Semantic cache hit")
+                return cached[1]
+            if cached is not None:
+                response_cache_stats["approximate"] += 1
+                print(f"Approximate semantic cache hit (similarity {similarity:.3f}); reusing its parse and match content")
+                return await _approximate_response(*cached, raw_text, query_embedding)
+            response_cache_stats["miss"] += 1
+
+    # The query embedding is memoized, so the search doesn't embed the text again
+    parsed_profile, recommendations = await asyncio.gather(
+        parse,
+        engine.find_similar_employees_by_text_async(raw_text)
+    )
+    
     target_profile = Employee(
         id="target_user",
         name="Candidate",
         email="candidate@example.com",
-        profile=type('obj', (object,), {
-            'role': parsed_profile.get("role", "Unknown"), 
-            'department': parsed_profile.get("department", "Unknown"), 
-            'seniority': parsed_profile.get("seniority", "Unknown"),
-            'skills': parsed_profile.get("skills", []), 
-            'projects': mock_projects, 
-            'interests': []
-        }),
+        profile=_profile_from_parsed(parsed_profile),
         raw_text=raw_text
     )
     
-    # Optimized Search
-    recommendations = engine.find_similar_employees_by_text(raw_text)
+    if request.stream:
+        # Per-candidate calls instead of one batch, so the first card can render before the slowest one finishes
+        return StreamingResponse(_stream_recommendations(target_profile, recommendations), media_type="application/x-ndjson")
     
-    # Parallelize LLM Calls
-    import asyncio
-    from concurrent.futures import ThreadPoolExecutor
-    
-    loop = asyncio.get_running_loop()
-    
-    def generate_details(emp):
-        return engine.generate_detailed_match(target_profile, emp)
+    # Parallelize LLM Calls (all candidates in flight at once on the event loop)
+    match_details_list = await engine.generate_detailed_matches_async(
+        target_profile, [rec['employee'] for rec in recommendations]
+    )
 
-    with ThreadPoolExecutor() as pool:
-        tasks = [
-            loop.run_in_executor(pool, generate_details, rec['employee'])
-            for rec in recommendations
-        ]
-        match_details_list = await asyncio.gather(*tasks)
-
-    response_list = []
-    for rec, match_details in zip(recommendations, match_details_list):
-        emp = rec['employee']
-        
-        resume_match = ResumeMatchResponse(
-            sharedSkills=match_details['shared_skills'],
-            matchingProjects=match_details['matching_projects'],
-            matchingDomains=match_details['matching_domains'],
-            techOverlap=match_details['tech_overlap'],
-            matchingSeniority=match_details['matching_seniority'],
-            reasonSummary=match_details['reason_summary']
-        )
-        
-        projects_response = [
-            ProjectResponse(name=p.name, description=p.description, tech=p.tech)
-            for p in emp.profile.projects
-        ]
-        
-        response_list.append(Recommendation(
-            id=emp.id,
-            name=emp.name,
-            title=emp.profile.role,
-            department=emp.profile.department,
-            location=emp.profile.location,
-            email=emp.email,
-            manager=emp.profile.manager,
-            experienceYears=emp.profile.experience_years,
-            professionalSummary=emp.profile.professional_summary,
-            skills=emp.profile.skills,
-            primarySkills=emp.profile.primary_skills,
-            secondarySkills=emp.profile.secondary_skills,
-            tools=emp.profile.tools,
-            projects=projects_response,
-            matchScore=rec['score'],
-            summary=match_details['reason_summary'],
-            avatarUrl=f"https://ui-avatars.com/api/?name={emp.name.replace(' ', '+')}&background=random",
-            resumeMatch=resume_match,
-            collaborationSuggestions=match_details['collaboration_suggestions'],
-            whyMatched=[]
-        ))
-        
-    return RecommendResponse(recommendations=response_list)
+    response_list = [
+        _build_recommendation(rec, match_details, [])
+        for rec, match_details in zip(recommendations, match_details_list)
+    ]
+    response = RecommendResponse(recommendations=response_list)
+    # Like the match memo, only keep responses whose parse and match content both came from the LLM
+    degraded = parsed_profile.get("fallback", False) or any(details["fallback"] for details in match_details_list)
+    if query_embedding is not None and not degraded:
+        # The parse is kept alongside the response for approximate hits
+        response_cache.put(query_embedding, (parsed_profile, response))
+    return response
 
 class MatchDetailsRequest(BaseModel):
     targetText: str
     employeeId: str
 
 class MatchDetailsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
     resumeMatch: ResumeMatchResponse
     collaborationSuggestions: List[str]
 
 @app.post("/api/match-details", response_model=MatchDetailsResponse)
 async def get_match_details(request: MatchDetailsRequest):
+    await embeddings_ready.wait()
     # Find the employee
-    emp = next((e for e in engine.employees if e.id == request.employeeId), None)
+    emp = engine.get_employee(request.employeeId)
     if not emp:
         raise HTTPException(status_code=404, detail="Employee not found")
         
@@ -379,37 +411,21 @@ async def get_match_details(request: MatchDetailsRequest):
         id="search_query",
         name="Search Context",
         email="search@example.com",
-        profile=type('obj', (object,), {
-            'role': 'Search Context', 
-            'department': 'Unknown', 
-            'seniority': 'Unknown',
-            'skills': request.targetText.split(), 
-            'projects': [], 
-            'interests': []
-        }),
+        profile=_query_profile(request.targetText),
         raw_text=request.targetText
     )
     
     # Generate detailed match info using LLM
-    match_details = engine.generate_detailed_match(target_profile, emp, use_llm=True)
-    
-    resume_match = ResumeMatchResponse(
-        sharedSkills=match_details['shared_skills'],
-        matchingProjects=match_details['matching_projects'],
-        matchingDomains=match_details['matching_domains'],
-        techOverlap=match_details['tech_overlap'],
-        matchingSeniority=match_details['matching_seniority'],
-        reasonSummary=match_details['reason_summary']
-    )
+    match_details = await engine.generate_detailed_match_async(target_profile, emp, use_llm=True)
     
     return MatchDetailsResponse(
-        resumeMatch=resume_match,
+        resumeMatch=_resume_match_response(match_details),
         collaborationSuggestions=match_details['collaboration_suggestions']
     )
 
 @app.get("/health")
 def health():
-    return {"status": "ok"}
+    return {"status": "ok", "ready": embeddings_ready.is_set(), "semanticCache": response_cache_stats}
 
 if __name__ == "__main__":
     import uvicorn